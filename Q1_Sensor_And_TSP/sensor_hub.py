@@ -15,39 +15,81 @@ becomes negligible (epsilon threshold).
 
 import math
 
-def euclidean_distance(x1, y1, x2, y2):
+def euclidean_distance(x1, y1, x2, y2, _hypot = math.hypot):
     # Core utility to measure signal attenuation between two points.
-    return math.sqrt((x2-x1)**2 + (y2-y1)**2)
+    # math.hypot is bound as a default argument, so it is a fast local lookup.
+    return _hypot(x2-x1, y2-y1)
+
+def _weiszfeld(xs, ys, x, y, epsilon, max_iter):
+    # Tight Weiszfeld kernel: coordinate columns in, scalar running sums only.
+    sqrt = math.sqrt
+    hypot = math.hypot
 
-def geometric_median(sensor_locations, epsilon = 1e-6, max_iter = 1000):
-    # Weiszfeld's algorithm: converges to the geometric median for L2 distance.
-    # Initial guess: centroid (fast, stable starting point).
-    x = sum(p[0] for p in sensor_locations) / len(sensor_locations)
-    y = sum(p[1] for p in sensor_locations) / len(sensor_locations)
-    
     for _ in range(max_iter):
-        num_x = 0
-        num_y = 0
-        denom = 0
-        
-        for xi, yi in sensor_locations:
-            d = euclidean_distance(x, y, xi, yi)
+        num_x = 0.0
+        num_y = 0.0
+        denom = 0.0
+        coincident = 0
+
+        for xi, yi in zip(xs, ys):
+            dx = xi - x
+            dy = yi - y
+            d = sqrt(dx*dx + dy*dy)
             if d == 0:
+                # Sensor sits on the estimate: its 1/d weight is undefined.
+                coincident += 1
                 continue
-            num_x += xi/d
-            num_y += yi / d
-            denom += 1/d
-            
+            inv = 1.0 / d
+            num_x += xi * inv
+            num_y += yi * inv
+            denom += inv
+
+        # Every sensor coincides with the estimate: it is the median.
+        if denom == 0:
+            break
+
         new_x = num_x / denom
         new_y = num_y / denom
-        
+
+        if coincident:
+            # Vardi-Zhang step: (rx, ry) is the pull of the other sensors.
+            # If it cannot outweigh the coincident ones, the estimate is
+            # already optimal; otherwise blend the plain Weiszfeld step
+            # with the current point so the iteration does not get stuck.
+            rx = num_x - x * denom
+            ry = num_y - y * denom
+            r = hypot(rx, ry)
+            if r <= coincident:
+                break
+            w = coincident / r
+            new_x = (1 - w) * new_x + w * x
+            new_y = (1 - w) * new_y + w * y
+
         # Stopping condition: tiny movement means convergence.
-        if euclidean_distance(x, y, new_x, new_y) < epsilon:
+        if hypot(new_x - x, new_y - y) < epsilon:
             break
         x, y = new_x, new_y
-        
+
     return x, y
 
+def geometric_median(sensor_locations, epsilon = 1e-6, max_iter = 1000):
+    # Weiszfeld's algorithm: converges to the geometric median for L2 distance.
+    # Split the sensors into flat coordinate columns once, so every iteration
+    # works on plain floats instead of unpacking tuples and calling helpers.
+    xs = [float(p[0]) for p in sensor_locations]
+    ys = [float(p[1]) for p in sensor_locations]
+
+    # Initial guess: centroid (fast, stable starting point).
+    x = sum(xs) / len(xs)
+    y = sum(ys) / len(ys)
+
+    # With one or two sensors the centroid already minimizes the total
+    # distance (any point on the segment does), so skip the iterations.
+    if len(xs) <= 2:
+        return x, y
+
+    return _weiszfeld(xs, ys, x, y, epsilon, max_iter)
+
 def total_distance(hub_x, hub_y, sensor_locations):
     # Objective function: total distance from hub to all sensors.
     return sum(
@@ -101,7 +143,8 @@ REMARKS:
   connecting them, specifically at the midpoint (2,2).
 - Weiszfeld's algorithm converges quickly for this problem (typically < 100 iterations).
 - Small floating-point variations are expected due to iterative convergence with epsilon.
-- The algorithm handles edge cases like coincident sensors gracefully by skipping
-  distance calculations when d=0.
+- The algorithm handles coincident sensors gracefully: a sensor at the current
+  estimate is skipped in the weights and the Vardi-Zhang step decides whether
+  to stay there or move on, and all-identical sensors return that point.
 """
     
\ No newline at end of file
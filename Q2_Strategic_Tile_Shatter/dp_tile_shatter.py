@@ -8,37 +8,57 @@ where points = left * current * right (out-of-bounds treated as 1).
 APPROACH EXPLANATION:
 I used interval dynamic programming to solve this tile-shattering problem. The approach:
 1. Pad the multiplier array with 1s at both ends to handle boundary cases uniformly
-2. Build a 2D DP table where dp[i][j] = max points from shattering tiles between i and j
+2. Build a DP table where dp[i][j] = max points from shattering tiles between i and j
+   (stored row-major in one flat list, i.e. dp[i*n + j], plus a column-major
+   mirror so the k-loop reads both sub-intervals as contiguous slices)
 3. Process intervals in increasing order of length (bottom-up approach)
 4. For each interval, try all possible positions k as the last tile to shatter
 5. When k is shattered last, tiles[i] and tiles[j] still exist, so points = tiles[i]*tiles[k]*tiles[j]
-6. Return dp[0][n-1] for the entire array
+6. Return dp[0][n-1] (flat index n-1) for the entire array
 
 Time Complexity: O(n^3) - three nested loops over interval positions
-Space Complexity: O(n^2) - 2D DP table
+Space Complexity: O(n^2) - flattened n x n DP table (and its mirror)
 """
 
-def max_points(tile_multipliers):
-    # Pad with 1 at both ends to handle boundary tiles uniformly.
-    tiles = [1] + tile_multipliers + [1]
+def _interval_dp(tiles):
+    # O(n^3) interval DP kernel over the padded tile list.
+    # rows[i*n + j] = dp[i][j] (row-major) and cols[j*n + i] = dp[i][j]
+    # (column-major mirror), so both dp[i][k] along row i and dp[k][j] down
+    # column j are contiguous slices and the k-loop walks them with zip
+    # instead of computing two flat indices per step.
     n = len(tiles)
-    
-    # dp[i][j] = max points from shattering tiles strictly between i and j.
-    dp = [[0]* n for _ in range(n)]
+    rows = [0] * (n * n)
+    cols = [0] * (n * n)
     
     # Build solutions by increasing interval length.
     for length in range(2, n):
         for i in range(0, n - length):
             j = i + length
+            # tiles[i] * tiles[j] is fixed for the interval; hoist it so the
+            # k-loop does a single multiply per candidate.
+            tij = tiles[i] * tiles[j]
+            row_i = i * n
+            col_j = j * n
+            best = 0
             
             # Choose k as the last tile to shatter within (i, j).
-            for k in range(i+1, j):
-                points = (
-                    dp[i][k] + dp[k][j] + tiles[i] * tiles[k] * tiles[j]
-                )
-                dp[i][j] = max(dp[i][j], points)
-                
-    return dp[0][n-1]
+            for left, right, tk in zip(rows[row_i + i + 1:row_i + j],
+                                       cols[col_j + i + 1:col_j + j],
+                                       tiles[i + 1:j]):
+                points = left + right + tij * tk
+                # Plain comparison instead of a max() builtin call per k.
+                if points > best:
+                    best = points
+            
+            rows[row_i + j] = best
+            cols[col_j + i] = best
+    
+    return rows[n - 1]
+
+def max_points(tile_multipliers):
+    # Pad with 1 at both ends to handle boundary tiles uniformly.
+    tiles = [1] + tile_multipliers + [1]
+    return _interval_dp(tiles)
     
 # Example Input Case 1
 print("=" * 70)
@@ -7,22 +7,24 @@ itself, its parent, or its children.
 """
 APPROACH EXPLANATION:
 I used tree dynamic programming with a post-order DFS traversal and state machine.
-The approach uses three states:
-- State 0: Node needs a service center
-- State 1: Node has a service center
-- State 2: Node is covered (by parent or children)
+The approach uses three states, encoded as single bits so both children can
+be tested at once with a bitwise OR:
+- State 1: Node needs a service center
+- State 2: Node has a service center
+- State 4: Node is covered (by parent or children)
 
 Algorithm:
-1. Traverse the tree post-order (children before parent)
+1. Traverse the tree post-order (children before parent), iteratively with an
+   explicit stack so deep or skewed trees cannot hit the recursion limit
 2. For each node, check children states:
-   - If any child needs service (state 0), place a center at current node (state 1)
-   - Else if any child has a center (state 1), current node is covered (state 2)
-   - Else current node needs service (state 0)
+   - If any child needs service (state 1), place a center at current node (state 2)
+   - Else if any child has a center (state 2), current node is covered (state 4)
+   - Else current node needs service (state 1)
 3. After traversing, if root needs service, add one more center
 4. Return total centers placed
 
 Time Complexity: O(n) - single tree traversal
-Space Complexity: O(h) - recursion stack height (h = tree height)
+Space Complexity: O(h) - explicit stack height (h = tree height)
 """
 
 class TreeNode:
@@ -34,92 +36,64 @@ class TreeNode:
 def min_service_centers(root):
     service_centers = 0
     
-    """States:
-    0 -> needs service
-    1 -> has service center
-    2 -> covered"""
+    """States (bit flags):
+    1 -> needs service
+    2 -> has service center
+    4 -> covered"""
     
-    def dfs(node):
-        # Post-order traversal to decide placement from bottom to top.
-        nonlocal service_centers
-        
-        if not node:
-            return 2  # Null nodes are considered covered
-        
-        left = dfs(node.left)
-        right = dfs(node.right)
-        
-        # If any child needs service, place a center here.
-        if left == 0 or right == 0:
-            service_centers += 1
-            return 1
-        
-        # If any child has a center, this node is covered.
-        if left == 1 or right == 1:
-            return 2
-        
-        # Otherwise, this node still needs service.
-        return 0
-    
-    root_state = dfs(root)
-    
-    # Ensure the root is covered.
-    if root_state == 0:
-        service_centers += 1
-        
-    return service_centers
-
-
-
-class TreeNode:
-    def __init__(self, val = 0, left = None, right = None):
-        self.val = val
-        self.left = left
-        self.right = right
-
-def min_service_centers(root):
-    service_centers = 0
-    
-    """States:
-    0 -> needs service
-    1 -> has service center
-    2 -> covered"""
+    if not root:
+        return 0  # Empty tree needs no centers
     
-    def dfs(node):
-        # Post-order traversal to decide placement from bottom to top.
-        nonlocal service_centers
-        
-        if not node:
-            return 2  # Null nodes are considered covered
-        
-        left = dfs(node.left)
-        right = dfs(node.right)
+    # Iterative post-order with an explicit stack of (node, visit) pairs:
+    # visit 0 descends left, visit 1 descends right, visit 2 resolves the
+    # node once both children are done. No recursion, so deep or skewed
+    # trees cannot hit the recursion limit.
+    # Child states are kept by id(node); missing (null) children count as
+    # covered, and each entry is dropped as soon as its parent reads it.
+    states = {}
+    stack = [(root, 0)]
+    while stack:
+        node, visit = stack.pop()
         
-        # If any child needs service, place a center here.
-        if left == 0 or right == 0:
-            service_centers += 1
-            return 1
-        
-        # If any child has a center, this node is covered.
-        if left == 1 or right == 1:
-            return 2
-        
-        # Otherwise, this node still needs service.
-        return 0
+        if visit == 0:
+            stack.append((node, 1))
+            if node.left:
+                stack.append((node.left, 0))
+        elif visit == 1:
+            stack.append((node, 2))
+            if node.right:
+                stack.append((node.right, 0))
+        else:
+            combined = states.pop(id(node.left), 4) | states.pop(id(node.right), 4)
+            
+            # If any child needs service, place a center here.
+            if combined & 1:
+                service_centers += 1
+                states[id(node)] = 2
+            
+            # If any child has a center, this node is covered.
+            elif combined & 2:
+                states[id(node)] = 4
+            
+            # Otherwise, this node still needs service.
+            else:
+                states[id(node)] = 1
     
-    root_state = dfs(root)
+    root_state = states[id(root)]
     
     # Ensure the root is covered.
-    if root_state == 0:
+    if root_state & 1:
         service_centers += 1
         
     return service_centers
 
-# Example Input Case 1: Balanced tree with 5 nodes
-print("=" * 70)
-print("INPUT CASE 1: Balanced binary tree with 5 nodes")
-print("=" * 70)
-print("""
+
+if __name__ == "__main__":
+    # Example Input Case 1: Balanced tree with 5 nodes
+    print("=" * 70)
+    print("INPUT CASE 1: Balanced binary tree with 5 nodes")
+    print("=" * 70)
+    print("""
 Tree structure:
        0
       / \\
@@ -128,20 +102,20 @@ Tree structure:
    0   0
 """)
 
-root_1 = TreeNode(0)
-root_1.left = TreeNode(0)
-root_1.left.right = TreeNode(0)
-root_1.left.left = TreeNode(0)
-root_1.right = TreeNode(0)
+    root_1 = TreeNode(0)
+    root_1.left = TreeNode(0)
+    root_1.left.right = TreeNode(0)
+    root_1.left.left = TreeNode(0)
+    root_1.right = TreeNode(0)
 
-result_1 = min_service_centers(root_1)
-print(f"Minimum service centers needed: {result_1}")
+    result_1 = min_service_centers(root_1)
+    print(f"Minimum service centers needed: {result_1}")
 
-# Example Input Case 2: Skewed tree (chain-like)
-print("\n" + "=" * 70)
-print("INPUT CASE 2: Skewed tree (right chain with 5 nodes)")
-print("=" * 70)
-print("""
+    # Example Input Case 2: Skewed tree (chain-like)
+    print("\n" + "=" * 70)
+    print("INPUT CASE 2: Skewed tree (right chain with 5 nodes)")
+    print("=" * 70)
+    print("""
 Tree structure:
        0
        |
@@ -154,14 +128,14 @@ Tree structure:
              0
 """)
 
-root_2 = TreeNode(0)
-root_2.right = TreeNode(0)
-root_2.right.right = TreeNode(0)
-root_2.right.right.right = TreeNode(0)
-root_2.right.right.right.right = TreeNode(0)
+    root_2 = TreeNode(0)
+    root_2.right = TreeNode(0)
+    root_2.right.right = TreeNode(0)
+    root_2.right.right.right = TreeNode(0)
+    root_2.right.right.right.right = TreeNode(0)
 
-result_2 = min_service_centers(root_2)
-print(f"Minimum service centers needed: {result_2}")
+    result_2 = min_service_centers(root_2)
+    print(f"Minimum service centers needed: {result_2}")
 
 """
 OUTPUT CASE 1 (Balanced 5-node tree):
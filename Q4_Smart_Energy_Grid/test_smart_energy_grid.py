@@ -0,0 +1,57 @@
+"""
+Test suite for the smart energy grid allocation
+"""
+
+from smart_energy_grid import hourly_sources, allocate_energy, demands, sources
+
+
+def source(id, hours, cost=1.0, type='Solar', capacity=10):
+    return {'id': id, 'type': type, 'capacity': capacity, 'hours': hours, 'cost': cost}
+
+
+def test_sources_sorted_by_cost():
+    """Each hour lists its open sources cheapest first"""
+    hour_sources = hourly_sources(
+        {6: {}, 20: {}},
+        [source('A', range(0, 24), cost=2.0), source('B', range(6, 19), cost=1.0)]
+    )
+    assert hour_sources[6][0] == ('B', 'A'), f"Got {hour_sources[6][0]}"
+    assert hour_sources[20][0] == ('A',), f"Got {hour_sources[20][0]}"
+    print("✓ Test 1 passed: Sources sorted by cost per hour")
+
+
+def test_repeated_hours():
+    """An hour listed twice marks only that hour as open"""
+    hour_sources = hourly_sources({3: {}, 4: {}}, [source('A', [3, 3])])
+    assert hour_sources[3][0] == ('A',), f"Got {hour_sources[3][0]}"
+    assert hour_sources[4][0] == (), f"Got {hour_sources[4][0]}"
+    print("✓ Test 2 passed: Repeated operating hours")
+
+
+def test_matches_membership_check():
+    """Availability agrees with a plain `hour in hours` check"""
+    hour_sources = hourly_sources(demands, sources)
+    for hour in demands:
+        expected = tuple(
+            s['id'] for s in sorted(sources, key=lambda s: s['cost']) if hour in s['hours']
+        )
+        assert hour_sources[hour][0] == expected, f"Hour {hour}: got {hour_sources[hour][0]}"
+    print("✓ Test 3 passed: Availability matches membership check")
+
+
+def test_sample_allocation_runs():
+    """The sample scenario allocates every hour within demand"""
+    results, _, _, _, _ = allocate_energy(demands, sources)
+    assert sorted(results) == sorted(demands), f"Got hours {sorted(results)}"
+    for hour, hour_result in results.items():
+        for district, info in hour_result['districts'].items():
+            assert sum(info['sources'].values()) <= info['demand'], f"Over-supplied {hour} {district}"
+    print("✓ Test 4 passed: Sample allocation")
+
+
+if __name__ == "__main__":
+    test_sources_sorted_by_cost()
+    test_repeated_hours()
+    test_matches_membership_check()
+    test_sample_allocation_runs()
+    print("\n🎉 All tests passed successfully!")
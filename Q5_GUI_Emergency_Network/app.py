@@ -31,18 +31,24 @@ Key Features:
 """
 
 # Emergency Network Simulator - Interactive GUI
+# Only modules needed on every run are imported here; page-specific ones
+# (pandas, failure analysis, coloring, rebalancing) are imported inside
+# their page branch so a session only pays for the pages it visits.
 import streamlit as st
-import pandas as pd
 from graph.graph_model import EmergencyGraph
-from graph.mst import kruskal_mst
-from graph.paths import find_k_disjoint_paths, dijkstra_shortest_path
-from graph.failure import FailureAnalyzer
-from graph.coloring import greedy_graph_coloring, validate_coloring, analyze_coloring_efficiency
+from graph.mst import minimum_spanning_tree, prefers_prim
+from graph.paths import (
+    suurballe_k_disjoint, dijkstra_all_targets,
+    dijkstra_incremental_on_node_removal, reconstruct_path,
+)
 from tree.tree_model import BinarySearchTree
-from tree.rebalance import rebalance_tree, analyze_tree_balance
 from utils.visualization import render_graph_with_pyvis, visualize_tree, create_algorithm_info_panel
 
 
+# Sample builders are cached with st.cache_data rather than cache_resource:
+# the app edits the graph/tree in place, and cache_data hands every session
+# its own deserialized copy, so edits never leak into the shared cache.
+@st.cache_data
 def build_sample_graph():
     """Build a sample emergency network for demonstration."""
     g = EmergencyGraph()
@@ -58,6 +64,7 @@ def build_sample_graph():
     return g
 
 
+@st.cache_data
 def build_sample_tree():
     """Build a sample tree for testing."""
     tree = BinarySearchTree()
@@ -67,6 +74,30 @@ def build_sample_tree():
     return tree
 
 
+# Algorithm results are memoized per graph state. EmergencyGraph.version
+# changes on every edit, so hashing the graph by its version turns a
+# repeated button press on an unchanged graph into a constant-time hit.
+GRAPH_HASH_FUNCS = {EmergencyGraph: lambda g: g.version}
+
+
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+def cached_mst(graph):
+    """Memoized minimum_spanning_tree (Kruskal, or Prim when dense), keyed on the graph version."""
+    return minimum_spanning_tree(graph)
+
+
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+def cached_all_targets(graph, src):
+    """Memoized dijkstra_all_targets, keyed on the graph version."""
+    return dijkstra_all_targets(graph, src)
+
+
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+def cached_disjoint_paths(graph, start, end, k):
+    """Memoized suurballe_k_disjoint, keyed on the graph version."""
+    return suurballe_k_disjoint(graph, start, end, k)
+
+
 # Page configuration
 st.set_page_config(page_title="Emergency Network Simulator", layout="wide", initial_sidebar_state="expanded")
 st.title("Emergency Network Simulator")
@@ -98,7 +129,8 @@ page = st.sidebar.radio(
 # ============================================================================
 if page == "Q1: MST":
     st.header("Q1: Minimum Spanning Tree")
-    create_algorithm_info_panel("Kruskal")
+    # Describe the algorithm cached_mst will actually run on this graph
+    create_algorithm_info_panel("Prim MST" if prefers_prim(graph) else "Kruskal MST")
     
     col1, col2 = st.columns([2, 1])
     
@@ -107,9 +139,8 @@ if page == "Q1: MST":
         
         if st.button("Calculate MST", use_container_width=True):
             with st.spinner("Computing..."):
-                mst_edges, mst_weight = kruskal_mst(graph)
+                mst_edges, mst_weight = cached_mst(graph)
                 st.session_state.mst_result = (mst_edges, mst_weight)
-                st.rerun()
         
         if 'mst_result' in st.session_state:
             mst_edges, mst_weight = st.session_state.mst_result
@@ -128,22 +159,25 @@ if page == "Q1: MST":
         
         # Add Node
         if st.button("Add Node", use_container_width=True, key="add_node_btn"):
-            existing_nodes = graph.get_all_cities()
-            new_node = max(existing_nodes) + 1 if existing_nodes else 0
+            new_node = graph.next_city_id()
             graph.add_city(new_node)
             st.success(f"Node {new_node} added")
             st.rerun()
         
         # Add Edge
-        st.write("**Add Edge:**")
-        col_a, col_b = st.columns(2)
-        with col_a:
-            edge_from = st.number_input("From", min_value=0, key="edge_from", step=1)
-        with col_b:
-            edge_to = st.number_input("To", min_value=0, key="edge_to", step=1)
-        edge_weight = st.number_input("Weight", min_value=1, value=5, key="edge_weight", step=1)
+        # Inputs live in a form so editing them does not rerun the script
+        # (and re-render the graph); only the submit button triggers a rerun.
+        with st.form("add_edge_form"):
+            st.write("**Add Edge:**")
+            col_a, col_b = st.columns(2)
+            with col_a:
+                edge_from = st.number_input("From", min_value=0, key="edge_from", step=1)
+            with col_b:
+                edge_to = st.number_input("To", min_value=0, key="edge_to", step=1)
+            edge_weight = st.number_input("Weight", min_value=1, value=5, key="edge_weight", step=1)
+            add_edge_submitted = st.form_submit_button("Add Edge", use_container_width=True)
         
-        if st.button("Add Edge", use_container_width=True, key="add_edge_btn"):
+        if add_edge_submitted:
             if edge_from != edge_to:
                 graph.add_road(edge_from, edge_to, edge_weight)
                 st.success(f"Edge {edge_from} ↔ {edge_to} added")
@@ -169,12 +203,14 @@ elif page == "Q2: Path Finder":
     
     with col1:
         st.subheader("Network Graph")
-        render_graph_with_pyvis(graph, height=500)
+        # Background view only; collapsed so reruns skip laying out the iframe
+        with st.expander("📍 Show Network Graph", expanded=False):
+            render_graph_with_pyvis(graph, height=500)
     
     with col2:
         st.subheader("Find Disjoint Paths")
         
-        all_cities = sorted(graph.get_all_cities())
+        all_cities = graph.get_sorted_cities()
         
         start = st.selectbox("From", all_cities, key="path_start")
         end = st.selectbox("To", all_cities, key="path_end", index=min(1, len(all_cities)-1))
@@ -182,7 +218,7 @@ elif page == "Q2: Path Finder":
         if start != end:
             k = st.number_input("# Disjoint Paths", 1, 5, 2, key="k")
             if st.button("Find K-Disjoint Paths", use_container_width=True):
-                paths = find_k_disjoint_paths(graph, start, end, k)
+                paths = cached_disjoint_paths(graph, start, end, k)
                 st.session_state.disjoint_paths = paths
         
         if 'disjoint_paths' in st.session_state:
@@ -195,6 +231,27 @@ elif page == "Q2: Path Finder":
 # PAGE: Q3 - TREE OPTIMIZER
 # ============================================================================
 elif page == "Q3: Tree Optimizer":
+    import pandas as pd
+    from tree.rebalance import AVLTree, rebalance_tree, analyze_tree_balance
+
+    # Trees carry no version stamp, so they are hashed by their pre-order
+    # values (which fix a BST's shape) plus size. One walk per rerun turns
+    # the analyses below into cache hits until the tree actually changes.
+    def tree_signature(tree):
+        return tuple(tree.preorder_traversal()), tree.size
+
+    TREE_HASH_FUNCS = {BinarySearchTree: tree_signature, AVLTree: tree_signature}
+
+    @st.cache_data(show_spinner=False, hash_funcs=TREE_HASH_FUNCS)
+    def cached_tree_analysis(tree):
+        """Memoized analyze_tree_balance, keyed on the tree signature."""
+        return analyze_tree_balance(tree)
+
+    @st.cache_data(show_spinner=False, hash_funcs=TREE_HASH_FUNCS)
+    def cached_rebalance(tree):
+        """Memoized rebalance_tree, keyed on the tree signature."""
+        return rebalance_tree(tree)
+    
     st.header("Q3: AVL Tree Rebalancing")
     
     st.markdown("""
@@ -217,7 +274,7 @@ elif page == "Q3: Tree Optimizer":
         visualize_tree(command_tree, "Original Command Hierarchy")
     
     with col_info:
-        analysis_before = analyze_tree_balance(command_tree)
+        analysis_before = cached_tree_analysis(command_tree)
         st.metric("Height", analysis_before['height'])
         st.metric("Balanced?", "Yes" if analysis_before['is_balanced'] else "No")
         
@@ -233,7 +290,7 @@ elif page == "Q3: Tree Optimizer":
     with col_btn:
         if st.button("Optimize (Rebalance)", use_container_width=True, key="rebal"):
             with st.spinner("Rebalancing tree..."):
-                balanced = rebalance_tree(command_tree)
+                balanced = cached_rebalance(command_tree)
                 st.session_state.balanced_tree = balanced
                 st.session_state.optimization_done = True
             st.success("Rebalancing complete!")
@@ -249,7 +306,7 @@ elif page == "Q3: Tree Optimizer":
             visualize_tree(st.session_state.balanced_tree, "Optimized Command Hierarchy")
         
         with col_info2:
-            analysis_after = analyze_tree_balance(st.session_state.balanced_tree)
+            analysis_after = cached_tree_analysis(st.session_state.balanced_tree)
             st.metric("Height", analysis_after['height'])
             st.metric("Balanced?", "✓ Yes" if analysis_after['is_balanced'] else "✗ No")
             
@@ -289,66 +346,47 @@ elif page == "Q3: Tree Optimizer":
 # PAGE: Q4 - FAILURE SIMULATION
 # ============================================================================
 elif page == "Q4: Failure Simulation":
-    st.header("Q4: Network Failure Simulation")
-    create_algorithm_info_panel("Failure Analysis")
+    import pandas as pd
+    from graph.failure import FailureAnalyzer
     
-    col1, col2, col3 = st.columns([1.5, 1, 1.5])
+    @st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+    def cached_node_failure(graph, failed):
+        """Memoized analyze_node_failure, keyed on the graph version."""
+        return FailureAnalyzer(graph).analyze_node_failure(failed)
     
-    with col1:
-        st.subheader("Network")
-        highlight_nodes = None
-        if 'failure_result' in st.session_state:
-            result = st.session_state.failure_result
-            highlight_nodes = {}
-            failed_node = result.get('failed_node')
-            if failed_node is not None:
-                highlight_nodes[failed_node] = '#808080'  # Failed node in grey
-
-        render_graph_with_pyvis(graph, height=400, highlight_nodes=highlight_nodes)
+    st.header("Q4: Network Failure Simulation")
+    create_algorithm_info_panel("Failure Analysis")
     
-    with col2:
+    # The controls and the impact panel are fragments: picking cities or
+    # toggling the path table reruns only that panel, not the network
+    # render. Simulate triggers a full rerun so every panel picks it up.
+    @st.fragment
+    def failure_controls(graph):
         st.subheader("Test Failure")
         
-        all_cities = sorted(graph.get_all_cities())
+        all_cities = graph.get_sorted_cities()
         start_node = st.selectbox("Start", all_cities, key="start_city")
         goal_node = st.selectbox("Goal", all_cities, key="goal_city", index=min(1, len(all_cities) - 1))
         failed = st.selectbox("Fail City", all_cities, key="fail_city")
         
         if st.button("Simulate", use_container_width=True):
-            analyzer = FailureAnalyzer(graph)
-            result = analyzer.analyze_node_failure(failed)
-            st.session_state.failure_result = result
-
-            # Shortest path before failure
-            path_before, dist_before = dijkstra_shortest_path(graph, start_node, goal_node)
-
-            # Shortest path after failure
-            graph.disable_city(failed)
-            path_after, dist_after = dijkstra_shortest_path(graph, start_node, goal_node)
-            graph.enable_city(failed)
-
-            # Baseline shortest paths from Start
-            baseline_paths = {}
-            baseline_distances = {}
-            for city in all_cities:
-                if city == start_node:
-                    continue
-                path, dist = dijkstra_shortest_path(graph, start_node, city)
-                baseline_paths[city] = path
-                baseline_distances[city] = dist
-
-            # Recomputed shortest paths after failure
-            graph.disable_city(failed)
-            new_paths = {}
-            new_distances = {}
-            for city in all_cities:
-                if city == start_node or city == failed:
-                    continue
-                path, dist = dijkstra_shortest_path(graph, start_node, city)
-                new_paths[city] = path
-                new_distances[city] = dist
-            graph.enable_city(failed)
-
+            st.session_state.failure_result = cached_node_failure(graph, failed)
+
+            # One Dijkstra sweep from Start answers every destination. The
+            # failure only disturbs the failed city's shortest-path subtree,
+            # so the post-failure result patches the baseline instead of
+            # running a second sweep; the graph itself is never toggled.
+            base_dist, base_prev = cached_all_targets(graph, start_node)
+            fail_dist, fail_prev = dijkstra_incremental_on_node_removal(
+                graph, base_dist, base_prev, failed
+            )
+
+            # Shortest path before and after failure
+            path_before, dist_before = reconstruct_path(base_dist, base_prev, goal_node)
+            path_after, dist_after = reconstruct_path(fail_dist, fail_prev, goal_node)
+
+            # Per-city paths are only walked out of the prev pointers when
+            # the table below is shown; the sweeps themselves are kept.
             st.session_state.failure_paths = {
                 'start': start_node,
                 'goal': goal_node,
@@ -357,13 +395,15 @@ elif page == "Q4: Failure Simulation":
                 'dist_before': dist_before,
                 'path_after': path_after,
                 'dist_after': dist_after,
-                'baseline_paths': baseline_paths,
-                'baseline_distances': baseline_distances,
-                'new_paths': new_paths,
-                'new_distances': new_distances
+                'baseline': (base_dist, base_prev),
+                'recomputed': (fail_dist, fail_prev)
             }
-    
-    with col3:
+
+            # The network and impact panels live outside this fragment.
+            st.rerun()
+
+    @st.fragment
+    def failure_impact(graph):
         if 'failure_result' in st.session_state:
             result = st.session_state.failure_result
             st.subheader("Impact")
@@ -374,25 +414,38 @@ elif page == "Q4: Failure Simulation":
 
             if 'failure_paths' in st.session_state:
                 path_info = st.session_state.failure_paths
-                baseline_distances = path_info['baseline_distances']
-                new_distances = path_info['new_distances']
-                baseline_paths = path_info['baseline_paths']
-                new_paths = path_info['new_paths']
+                base_dist, base_prev = path_info['baseline']
+                fail_dist, fail_prev = path_info['recomputed']
                 failed = path_info['failed']
                 start_node = path_info['start']
                 goal_node = path_info['goal']
-
-                rows = []
+                # Only the table walks every city, so the list is fetched here.
+                all_cities = graph.get_sorted_cities()
+
+                # Built column by column, so pandas gets one list per column
+                # instead of inferring dtypes across a list of row dicts.
+                table = {
+                    "City": [], "Baseline Path": [], "Baseline Distance": [],
+                    "New Path": [], "New Distance": [], "Increase": [], "Status": [],
+                }
                 total_increase = 0
                 increase_count = 0
 
+                # The per-city path table costs a path walk and two joins per
+                # city, so it is only built when asked for. Distances (and the
+                # average below) come straight from the stored sweeps.
+                st.divider()
+                st.subheader("Recomputed Shortest Paths (from Start)")
+                show_table = st.checkbox("Show per-city paths", key="show_q4_table")
+
+                # Each city appears on many paths, so convert it to text once.
+                str_nodes = {c: str(c) for c in all_cities}
+
                 for city in all_cities:
                     if city == start_node or city == failed:
                         continue
-                    base = baseline_distances.get(city, float('inf'))
-                    new = new_distances.get(city, float('inf'))
-                    base_path = baseline_paths.get(city)
-                    new_path = new_paths.get(city)
+                    base = base_dist.get(city, float('inf'))
+                    new = fail_dist.get(city, float('inf'))
 
                     if new == float('inf'):
                         status = "Disconnected"
@@ -407,24 +460,46 @@ elif page == "Q4: Failure Simulation":
                             total_increase += max(delta, 0)
                             increase_count += 1
 
-                    rows.append({
-                        "City": city,
-                        "Baseline Path": " → ".join(map(str, base_path)) if base_path else "N/A",
-                        "Baseline Distance": "∞" if base == float('inf') else base,
-                        "New Path": " → ".join(map(str, new_path)) if new_path else "Disconnected",
-                        "New Distance": "∞" if new == float('inf') else new,
-                        "Increase": increase,
-                        "Status": status
-                    })
+                    if not show_table:
+                        continue
+                    base_path, _ = reconstruct_path(base_dist, base_prev, city)
+                    new_path, _ = reconstruct_path(fail_dist, fail_prev, city)
+
+                    table["City"].append(city)
+                    table["Baseline Path"].append(" → ".join([str_nodes[x] for x in base_path]) if base_path else "N/A")
+                    table["Baseline Distance"].append("∞" if base == float('inf') else base)
+                    table["New Path"].append(" → ".join([str_nodes[x] for x in new_path]) if new_path else "Disconnected")
+                    table["New Distance"].append("∞" if new == float('inf') else new)
+                    table["Increase"].append(increase)
+                    table["Status"].append(status)
 
-                st.divider()
-                st.subheader("Recomputed Shortest Paths (from Start)")
-                st.dataframe(pd.DataFrame(rows), use_container_width=True)
+                if show_table:
+                    st.dataframe(pd.DataFrame(table), use_container_width=True)
 
                 if increase_count > 0:
                     avg_increase = total_increase / increase_count
                     st.metric("Avg. Increase in Delivery Time", f"{avg_increase:.2f}")
 
+    col1, col2, col3 = st.columns([1.5, 1, 1.5])
+    
+    with col1:
+        st.subheader("Network")
+        highlight_nodes = None
+        if 'failure_result' in st.session_state:
+            result = st.session_state.failure_result
+            highlight_nodes = {}
+            failed_node = result.get('failed_node')
+            if failed_node is not None:
+                highlight_nodes[failed_node] = '#808080'  # Failed node in grey
+
+        render_graph_with_pyvis(graph, height=400, highlight_nodes=highlight_nodes)
+    
+    with col2:
+        failure_controls(graph)
+    
+    with col3:
+        failure_impact(graph)
+
     # Shortest path canvas
     if 'failure_paths' in st.session_state:
         path_info = st.session_state.failure_paths
@@ -458,6 +533,18 @@ elif page == "Q4: Failure Simulation":
 # PAGE: Q5 - GRAPH COLORING
 # ============================================================================
 elif page == "Q5: Graph Coloring":
+    from graph.coloring import greedy_graph_coloring, validate_coloring
+
+    @st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+    def cached_coloring(graph):
+        """Memoized greedy coloring and its validity, keyed on the graph version."""
+        coloring, chromatic = greedy_graph_coloring(graph)
+        is_valid, _ = validate_coloring(graph, coloring)
+        # Keyed in sorted city order once here, so the assignment list
+        # below can be shown on every rerun without sorting again.
+        coloring = {city: coloring[city] for city in graph.get_sorted_cities() if city in coloring}
+        return coloring, chromatic, is_valid
+    
     st.header("Q5: Graph Coloring - Frequency Assignment")
     
     st.markdown("""
@@ -475,17 +562,15 @@ elif page == "Q5: Graph Coloring":
     
     with col1:
         st.subheader("Network Graph")
-        render_graph_with_pyvis(graph, height=500)
+        # Background view only; collapsed so reruns skip laying out the iframe
+        with st.expander("📍 Show Network Graph", expanded=False):
+            render_graph_with_pyvis(graph, height=500)
     
     with col2:
         st.subheader("Assign Frequencies")
         
         if st.button("Color Graph", use_container_width=True):
-            coloring, chromatic = greedy_graph_coloring(graph)
-            is_valid, violations = validate_coloring(graph, coloring)
-            analysis = analyze_coloring_efficiency(graph, coloring)
-            st.session_state.coloring = (coloring, chromatic, is_valid)
-            st.rerun()
+            st.session_state.coloring = cached_coloring(graph)
         
         if 'coloring' in st.session_state:
             coloring, chromatic, is_valid = st.session_state.coloring
@@ -495,8 +580,8 @@ elif page == "Q5: Graph Coloring":
             
             st.divider()
             st.write("**Frequency Assignment:**")
-            for city in sorted(coloring.keys()):
-                st.write(f"Hub {city}: Frequency {coloring[city] + 1}")
+            for city, color in coloring.items():
+                st.write(f"Hub {city}: Frequency {color + 1}")
     
     # Colored graph visualization
     if 'coloring' in st.session_state:
@@ -23,13 +23,13 @@ The analysis provides quantitative metrics:
 This information guides infrastructure investment and disaster preparedness planning.
 
 Time Complexity:
-- Node failure analysis: O(V²) - pathfinding between all pairs
-- Edge failure analysis: O(V²)
+- Node failure analysis: O(V + E) - one component labelling
+- Edge failure analysis: O(V × (V+E) log V) - one Dijkstra sweep per start city
+- Cascade simulation: O(iterations × (V + E)) - one component labelling per phase
 - Connectivity check: O(V + E) using BFS
 """
 
-from collections import deque
-from graph.paths import dijkstra_shortest_path, get_affected_nodes
+from graph.paths import dijkstra_all_targets, reconstruct_path, connected_components
 
 
 class FailureAnalyzer:
@@ -53,7 +53,7 @@ class FailureAnalyzer:
         """
         Analyzes impact of a single node failure.
         
-        Time Complexity: O(V^2 + E) - one shortest path computation per node
+        Time Complexity: O(V + E) - one component labelling after the failure
         Space Complexity: O(V)
         
         Parameters:
@@ -76,49 +76,49 @@ class FailureAnalyzer:
             'connectivity_loss': 0  # Percentage of lost connections
         }
         
-        # Get affected nodes
-        affected = get_affected_nodes(self.graph, failed_node)
-        analysis['affected_nodes'] = affected
+        # Label components with the failed city treated as offline. The
+        # graph itself is not toggled, so its version (and any result cached
+        # on it) survives the analysis.
+        components = connected_components(self.graph, {failed_node})
         
-        # Simulate failure
-        self.graph.disable_city(failed_node)
+        # Get affected nodes: everything outside the largest component,
+        # the same rule get_affected_nodes applies.
+        if len(components) > 1:
+            largest = max(components, key=len)
+            for component in components:
+                if component != largest:
+                    analysis['affected_nodes'].update(component)
         
-        # Check connectivity for all pairs
-        all_cities = self.graph.get_all_cities()
-        total_pairs = 0
-        lost_connections = 0
+        # Check connectivity for all pairs. Roads are undirected, so two
+        # cities are connected exactly when they share a component: one BFS
+        # labelling answers every pair instead of a Dijkstra run per pair.
+        active_count = sum(len(component) for component in components)
         
-        for start in all_cities:
-            if start == failed_node or start in self.graph.disabled_nodes:
-                continue
-            
-            for end in all_cities:
-                if end == failed_node or end in self.graph.disabled_nodes or end == start:
-                    continue
-                
-                total_pairs += 1
-                
-                # Try to find path after failure
-                path, distance = dijkstra_shortest_path(self.graph, start, end)
-                
-                if path is None:
-                    lost_connections += 1
-                    if end not in analysis['isolated_nodes']:
-                        analysis['isolated_nodes'].add(end)
+        # Ordered pairs (start, end), minus those inside one component.
+        total_pairs = active_count * (active_count - 1)
+        lost_connections = total_pairs - sum(
+            len(component) * (len(component) - 1) for component in components
+        )
+        
+        # With more than one component, every city is unreachable from
+        # some other city.
+        if len(components) > 1:
+            analysis['isolated_nodes'] = set().union(*components)
         
         if total_pairs > 0:
             analysis['connectivity_loss'] = (lost_connections / total_pairs) * 100
         
-        # Re-enable node
-        self.graph.enable_city(failed_node)
-        
         return analysis
     
     def analyze_edge_failure(self, city1, city2):
         """
         Analyzes impact of a single edge (road) failure.
         
-        Time Complexity: O(V^2)
+        The road stays marked for the whole scan, so the graph state (and
+        its memoized adjacency) is shared by one Dijkstra sweep per start
+        city; every destination's route is read off that sweep.
+        
+        Time Complexity: O(V × (V+E) log V)
         Space Complexity: O(V)
         
         Parameters:
@@ -139,18 +139,19 @@ class FailureAnalyzer:
         self.graph.mark_vulnerable_road(city1, city2)
         
         # Recalculate paths
-        for start in self.graph.get_all_cities():
-            for end in self.graph.get_all_cities():
+        all_cities = self.graph.get_all_cities()
+        for start in all_cities:
+            dist, prev = dijkstra_all_targets(self.graph, start)
+            for end in all_cities:
                 if start != end:
-                    path, distance = dijkstra_shortest_path(self.graph, start, end)
+                    path, distance = reconstruct_path(dist, prev, end)
                     
                     if path and city1 in path and city2 in path:
                         # This path was affected
                         analysis['affected_paths'].append((start, end))
         
         # Remove the vulnerable marking
-        self.graph.vulnerable_edges.discard((city1, city2))
-        self.graph.vulnerable_edges.discard((city2, city1))
+        self.graph.unmark_vulnerable_road(city1, city2)
         
         return analysis
     
@@ -159,9 +160,10 @@ class FailureAnalyzer:
         Simulates cascading failures where one failure triggers others.
         
         Algorithm: Uses threshold-based model where nodes fail if connectivity
-        drops below threshold.
+        drops below threshold. Reachability is read from one component
+        labelling per phase instead of a search per node.
         
-        Time Complexity: O(iterations * (V^2 + E))
+        Time Complexity: O(iterations * (V + E))
         Space Complexity: O(V)
         
         Parameters:
@@ -185,19 +187,23 @@ class FailureAnalyzer:
             phase += 1
             newly_failed = set()
             
-            # Analyze each active node
-            for node in self.graph.get_all_cities():
-                if node not in failed and node not in self.graph.disabled_nodes:
-                    # Check connectivity to critical nodes
-                    connected_count = 0
-                    total_critical = 0
+            # Only reachability is used, so one component labelling per
+            # phase replaces a Dijkstra sweep per node: a node reaches
+            # exactly the non-failed cities in its own component.
+            all_cities = self.graph.get_all_cities()
+            total_active = len(all_cities) - len(failed & self.graph.graph.keys())
+            
+            for component in connected_components(self.graph):
+                reachable = len(component) - len(component & failed)
+                
+                # Analyze each active node
+                for node in component:
+                    if node in failed:
+                        continue
                     
-                    for other in self.graph.get_all_cities():
-                        if other not in failed and other != node:
-                            total_critical += 1
-                            path, _ = dijkstra_shortest_path(self.graph, node, other)
-                            if path is not None:
-                                connected_count += 1
+                    # Check connectivity to critical nodes
+                    connected_count = reachable - 1
+                    total_critical = total_active - 1
                     
                     if total_critical > 0:
                         connectivity = connected_count / total_critical
@@ -271,5 +277,6 @@ Remarks:
 - Cascade failure detection prevents catastrophic network collapse scenarios.
 - Path reliability calculation guides emergency routing decisions during disasters.
 - BFS-based connectivity analysis is efficient at O(V + E) per failure scenario.
-- Temporary disable/enable mechanism allows testing without modifying graph structure.
+- Temporary marking allows edge what-ifs without modifying graph structure; node
+  what-ifs pass the failed city to the component labelling and leave the graph as is.
 """
@@ -18,8 +18,19 @@ The implementation maintains three key data structures:
 1. graph: adjacency list {city: [(neighbor, weight), ...]}
 2. vulnerable_edges: set of edges marked as at-risk
 3. disabled_nodes: set of cities currently offline (for failure simulation)
+
+Every mutation also stamps the graph with a fresh `version` number, which
+callers use as a cheap cache key for results computed from the graph.
 """
 
+from itertools import count
+from operator import itemgetter
+
+
+# Process-wide version source: every graph state gets a number no other
+# graph (or earlier state of the same graph) has used.
+_versions = count()
+
 
 class EmergencyGraph:
     """
@@ -44,6 +55,32 @@ class EmergencyGraph:
         # Disabled nodes are excluded from path computations.
         self.disabled_nodes = set()
 
+        # Changes whenever the network changes (see _touch), so two graphs
+        # with equal versions are guaranteed to be in the same state.
+        self.version = next(_versions)
+
+        # Memoized sorted city list, stored as (version, cities).
+        self._sorted_cities = (None, [])
+
+        # Memoized index-based adjacency, stored as (version, adjacency).
+        self._indexed = (None, None)
+
+        # Memoized compressed sparse row adjacency, stored as (version, csr).
+        self._csr = (None, None)
+
+        # Memoized weight-sorted edge tuple, stored as (version, edges).
+        self._sorted_edges = (None, ())
+
+        # Memoized endpoint numbers of the sorted edges (see get_sorted_edge_ends).
+        self._sorted_edge_ends = (None, None)
+
+        # One past the largest integer city id ever added (see next_city_id).
+        self._next_id = 0
+
+    def _touch(self):
+        """Stamps the graph with a new version after a mutation."""
+        self.version = next(_versions)
+
     # Node (City / Hub) Operations
 
     def add_city(self, city):
@@ -53,6 +90,16 @@ class EmergencyGraph:
         """
         if city not in self.graph:
             self.graph[city] = []
+            if isinstance(city, int) and city >= self._next_id:
+                self._next_id = city + 1
+            self._touch()
+
+    def next_city_id(self):
+        """
+        Returns an unused integer id for a new city in O(1).
+        Ids are not reused after a city is removed.
+        """
+        return self._next_id
 
     def remove_city(self, city):
         """
@@ -67,6 +114,7 @@ class EmergencyGraph:
                 ]
             del self.graph[city]
             self.disabled_nodes.discard(city)
+            self._touch()
 
     def disable_city(self, city):
         """
@@ -75,6 +123,7 @@ class EmergencyGraph:
         """
         if city in self.graph:
             self.disabled_nodes.add(city)
+            self._touch()
 
     def enable_city(self, city):
         """
@@ -82,6 +131,7 @@ class EmergencyGraph:
         This restores the city for routing operations.
         """
         self.disabled_nodes.discard(city)
+        self._touch()
 
 
     # Edge (Road) Operations
@@ -98,6 +148,7 @@ class EmergencyGraph:
 
         self.graph[city1].append((city2, weight))
         self.graph[city2].append((city1, weight))
+        self._touch()
 
     def remove_road(self, city1, city2):
         """
@@ -114,6 +165,7 @@ class EmergencyGraph:
 
             self.vulnerable_edges.discard((city1, city2))
             self.vulnerable_edges.discard((city2, city1))
+            self._touch()
 
     def mark_vulnerable_road(self, city1, city2):
         """
@@ -123,6 +175,16 @@ class EmergencyGraph:
         if city1 in self.graph and city2 in self.graph:
             self.vulnerable_edges.add((city1, city2))
             self.vulnerable_edges.add((city2, city1))
+            self._touch()
+
+    def unmark_vulnerable_road(self, city1, city2):
+        """
+        Clears the vulnerable marking from a road (both directions).
+        Used to restore the network after an edge-failure what-if.
+        """
+        self.vulnerable_edges.discard((city1, city2))
+        self.vulnerable_edges.discard((city2, city1))
+        self._touch()
 
     def is_road_vulnerable(self, city1, city2):
         """
@@ -140,6 +202,18 @@ class EmergencyGraph:
         """
         return list(self.graph.keys())
 
+    def get_sorted_cities(self):
+        """
+        Returns a list of all cities in sorted order.
+        The sort is memoized per version, so repeated calls on an unchanged
+        graph (e.g. every UI rerun) cost O(V) for the copy, not O(V log V).
+        """
+        version, cities = self._sorted_cities
+        if version != self.version:
+            cities = sorted(self.graph)
+            self._sorted_cities = (self.version, cities)
+        return list(cities)
+
     def get_all_edges(self):
         """
         Returns a list of all unique edges in the network.
@@ -159,6 +233,41 @@ class EmergencyGraph:
 
         return edges
 
+    def get_sorted_edges(self):
+        """
+        Returns all unique edges ordered by weight, as a tuple of
+        (city1, city2, weight). Equal weights keep get_all_edges order.
+
+        The sort is memoized per version, so Kruskal on an unchanged graph
+        only pays for the union-find sweep. A tuple is returned so the
+        shared copy cannot be edited by callers.
+        """
+        version, edges = self._sorted_edges
+        if version != self.version:
+            edges = tuple(sorted(self.get_all_edges(), key=itemgetter(2)))
+            self._sorted_edges = (self.version, edges)
+        return edges
+
+    def get_sorted_edge_ends(self):
+        """
+        Returns the endpoints of get_sorted_edges() as city numbers, as a
+        tuple (first, second) of lists: edge k joins cities first[k] and
+        second[k], numbered by their position in get_all_cities().
+
+        Lets union-find sweeps run on plain ints with no per-edge hashing.
+        Memoized per version alongside the sorted edges.
+        """
+        version, ends = self._sorted_edge_ends
+        if version != self.version:
+            edges = self.get_sorted_edges()
+            index = {city: i for i, city in enumerate(self.graph)}
+            ends = (
+                [index[city1] for city1, _, _ in edges],
+                [index[city2] for _, city2, _ in edges],
+            )
+            self._sorted_edge_ends = (self.version, ends)
+        return ends
+
     def get_active_neighbors(self, city):
         """
         Returns neighbors of a city excluding:
@@ -178,6 +287,59 @@ class EmergencyGraph:
 
         return neighbors
 
+    def get_indexed_adjacency(self):
+        """
+        Returns the network with cities renumbered 0..V-1, as a tuple
+        (cities, index, adjacency):
+        - cities: list mapping index -> city
+        - index: dictionary mapping city -> index
+        - adjacency: adjacency[i] = [(j, weight), ...], vulnerable roads excluded
+
+        Path algorithms scan this with list indexing instead of hashing
+        cities and checking road tuples per relaxation. It is built once
+        per version, so every algorithm run on the same graph state shares
+        it. Disabled cities stay in, since failure what-ifs toggle them.
+        """
+        version, indexed = self._indexed
+        if version != self.version:
+            cities = list(self.graph)
+            index = {city: i for i, city in enumerate(cities)}
+            vulnerable = self.vulnerable_edges
+            adjacency = [
+                [(index[neighbor], weight) for neighbor, weight in self.graph[city]
+                 if (city, neighbor) not in vulnerable]
+                for city in cities
+            ]
+            indexed = (cities, index, adjacency)
+            self._indexed = (self.version, indexed)
+        return indexed
+
+    def get_csr_adjacency(self):
+        """
+        Returns get_indexed_adjacency() in compressed sparse row form, as a
+        tuple (indptr, neighbors, weights) of flat lists: the roads of city i
+        are positions indptr[i] to indptr[i + 1] - 1, with neighbors holding
+        the other end's index and weights the road weight.
+
+        Traversals that only need neighbor indices (BFS, coloring) scan one
+        slice of ints instead of unpacking a (j, weight) tuple per road.
+        Memoized per version alongside the indexed adjacency.
+        """
+        version, csr = self._csr
+        if version != self.version:
+            _, _, adjacency = self.get_indexed_adjacency()
+            indptr = [0]
+            neighbors = []
+            weights = []
+            for row in adjacency:
+                for j, weight in row:
+                    neighbors.append(j)
+                    weights.append(weight)
+                indptr.append(len(neighbors))
+            csr = (indptr, neighbors, weights)
+            self._csr = (self.version, csr)
+        return csr
+
     def get_active_graph(self):
         """
         Returns a filtered adjacency list excluding disabled cities
@@ -201,4 +363,10 @@ Remarks:
 - Failure simulation (disabled nodes) allows testing network resilience without modifying structure.
 - Vulnerable edge marking enables disaster-aware routing decisions.
 - Active graph queries provide clean separation between full graph and operational state.
+- The version stamp lets callers memoize results per graph state in O(1).
+- The index-based adjacency is rebuilt at most once per version and shared by
+  all path computations on that state.
+- The CSR view of the indexed adjacency is built at most once per version too.
+- The weight-sorted edge list (and its numbered endpoints) is likewise built
+  at most once per version.
 """
@@ -21,7 +21,7 @@ Steps:
 4. Stop when (V-1) edges are added
 
 Time Complexity: O(E log E) dominated by sorting
-Space Complexity: O(V) for Union-Find structures
+Space Complexity: O(V) for Union-Find structures (flat lists over city numbers)
 """
 
 # ---------------------------------------------------
@@ -31,11 +31,19 @@ Space Complexity: O(V) for Union-Find structures
 def find(parent, city):
     """
     Finds the root of the set containing city.
+    `parent` may be a dictionary keyed by city or a list indexed by city number.
     Uses path compression to flatten tree structure for faster future lookups.
+    Iterative (two passes: find the root, then repoint the path to it), so
+    long chains cost no Python call frames.
     """
-    if parent[city] != city:
-        parent[city] = find(parent, parent[city])  # Path compression
-    return parent[city]
+    root = city
+    while parent[root] != root:
+        root = parent[root]
+
+    # Path compression
+    while parent[city] != root:
+        parent[city], city = root, parent[city]
+    return root
 
 
 def union(parent, rank, city1, city2):
@@ -47,14 +55,57 @@ def union(parent, rank, city1, city2):
     root2 = find(parent, city2)
 
     if root1 != root2:
-        # Attach smaller tree under larger tree
-        if rank[root1] < rank[root2]:
-            parent[root1] = root2
-        elif rank[root1] > rank[root2]:
-            parent[root2] = root1
-        else:
-            parent[root2] = root1
-            rank[root1] += 1
+        _link(parent, rank, root1, root2)
+
+
+def _link(parent, rank, root1, root2):
+    """Joins two distinct roots by rank (the second half of union)."""
+    # Attach smaller tree under larger tree
+    if rank[root1] < rank[root2]:
+        parent[root1] = root2
+    elif rank[root1] > rank[root2]:
+        parent[root2] = root1
+    else:
+        parent[root2] = root1
+        rank[root1] += 1
+
+
+def _kruskal_sweep(first, second, n):
+    """
+    Numeric kernel of Kruskal: scans weight-sorted edges given as endpoint
+    number lists and returns the positions of the edges that join two
+    different sets. Parent and rank are flat lists over 0..n-1.
+    """
+    # Initialize Union-Find structures for cycle detection
+    parent = list(range(n))  # Each city starts in its own set
+    rank = [0] * n           # Initial rank is 0
+    taken = []
+
+    # A spanning tree has V-1 edges; once reached, every later edge
+    # would close a cycle, so the scan can stop there.
+    needed = n - 1
+    if needed <= 0:
+        return taken
+
+    for k, (city1, city2) in enumerate(zip(first, second)):
+        # Check if adding this edge creates a cycle. Path compression keeps
+        # most cities at most one step from their root, so that case is
+        # read inline and find is only called for longer paths. The roots
+        # found here are linked directly instead of being looked up again.
+        root1 = parent[city1]
+        if parent[root1] != root1:
+            root1 = find(parent, root1)
+        root2 = parent[city2]
+        if parent[root2] != root2:
+            root2 = find(parent, root2)
+        if root1 != root2:
+            # No cycle - take the edge and merge sets
+            _link(parent, rank, root1, root2)
+            taken.append(k)
+            if len(taken) == needed:
+                break
+
+    return taken
 
 
 # ---------------------------------------------------
@@ -76,39 +127,135 @@ def kruskal_mst(graph):
         total_weight: sum of weights in MST
     """
 
+    # Edges by weight (greedy choice: lightest first). The graph keeps
+    # this order, and the endpoints as city numbers, per version, so
+    # reruns on an unchanged graph skip both the sort and the numbering.
+    edges = graph.get_sorted_edges()
+    first, second = graph.get_sorted_edge_ends()
+
+    # Union-Find sweep over plain ints picks the MST edges
+    taken = _kruskal_sweep(first, second, len(graph.graph))
+
+    mst_edges = [edges[k] for k in taken]
+    total_weight = sum(weight for _, _, weight in mst_edges)
+
+    return mst_edges, total_weight
+
+
+# ---------------------------------------------------
+# Prim's Algorithm (dense-graph alternative)
+# ---------------------------------------------------
+
+# Road density (roads / possible city pairs) from which Prim's array form
+# beats Kruskal here: below it Kruskal's early stop wins, above it the
+# E log E sort dominates.
+PRIM_MIN_DENSITY = 0.3
+
+
+def prim_mst(graph):
+    """
+    Computes the Minimum Spanning Tree using Prim's algorithm.
+
+    Grows the tree from a start city, always adding the city reachable by
+    the lightest road from the tree. The array form keeps one key per city
+    (lightest known road into the tree) and picks the next city with a
+    single min() over that list, so no edge sort or heap is needed. That
+    suits dense graphs, where E approaches V² anyway. Restarting from an
+    unreached city gives a spanning forest on disconnected graphs, like
+    kruskal_mst.
+
+    With equal weights the tree may differ from Kruskal's; the total
+    weight is the same.
+
+    Time Complexity: O(V² + E)
+    Space Complexity: O(V + E)
+
+    Parameters:
+        graph (EmergencyGraph): Custom graph object
+
+    Returns:
+        mst_edges: list of edges (u, v, weight) in MST
+        total_weight: sum of weights in MST
+    """
+
     mst_edges = []
     total_weight = 0
 
-    # Initialize Union-Find structures for cycle detection
-    parent = {}
-    rank = {}
-
-    for city in graph.get_all_cities():
-        parent[city] = city  # Each city starts in its own set
-        rank[city] = 0       # Initial rank is 0
-
-    # Sort edges by weight (greedy choice: lightest first)
-    edges = graph.get_all_edges()
-    edges.sort(key=lambda edge: edge[2])
-
-    # Process edges in sorted order
-    for city1, city2, weight in edges:
-        # Check if adding this edge creates a cycle
-        if find(parent, city1) != find(parent, city2):
-            # No cycle - add edge to MST and merge sets
-            union(parent, rank, city1, city2)
-            mst_edges.append((city1, city2, weight))
-            total_weight += weight
+    # Every road counts, vulnerable or not, as in kruskal_mst
+    cities = graph.get_all_cities()
+    index = {city: i for i, city in enumerate(cities)}
+    roads = [[(index[neighbor], weight) for neighbor, weight in graph.graph[city]]
+             for city in cities]
+
+    n = len(cities)
+    inf = float('inf')
+    key = [inf] * n          # Lightest road from the tree; inf once in the tree
+    parent = [-1] * n
+    in_tree = bytearray(n)
+    next_root = 0
+
+    for _ in range(n):
+        lightest = min(key)
+        if lightest == inf:
+            # Current component finished: start the next one
+            while in_tree[next_root]:
+                next_root += 1
+            city = next_root
+        else:
+            city = key.index(lightest)
+            mst_edges.append((cities[parent[city]], cities[city], lightest))
+            total_weight += lightest
+
+        in_tree[city] = 1
+        key[city] = inf
+
+        # Relax roads out of the newly added city
+        for neighbor, weight in roads[city]:
+            if weight < key[neighbor] and not in_tree[neighbor]:
+                key[neighbor] = weight
+                parent[neighbor] = city
 
     return mst_edges, total_weight
 
 
+def prefers_prim(graph):
+    """
+    Returns True when the graph is dense enough (PRIM_MIN_DENSITY and
+    above) for minimum_spanning_tree to pick prim_mst over kruskal_mst.
+
+    Density is read from adjacency list lengths in O(V).
+    """
+    v = len(graph.graph)
+    roads = sum(len(neighbors) for neighbors in graph.graph.values()) / 2
+    pairs = v * (v - 1) / 2
+
+    return pairs > 0 and roads / pairs >= PRIM_MIN_DENSITY
+
+
+def minimum_spanning_tree(graph):
+    """
+    Computes the MST with whichever algorithm suits the graph's density:
+    prim_mst at PRIM_MIN_DENSITY and above, kruskal_mst below it
+    (see prefers_prim).
+
+    Returns:
+        mst_edges: list of edges (u, v, weight) in MST
+        total_weight: sum of weights in MST
+    """
+    if prefers_prim(graph):
+        return prim_mst(graph)
+    return kruskal_mst(graph)
+
 """
 Remarks:
 - Kruskal's algorithm is optimal for MST problem (proven by cut property).
 - Union-Find with path compression and union by rank provides O(α(n)) per operation,
   where α is the inverse Ackermann function (effectively constant for practical inputs).
 - Total complexity O(E log E) makes it efficient for both sparse and dense graphs.
+- The sorted edge list is memoized on the graph, so repeat runs on the same
+  version cost only the O(E α(V)) union-find sweep.
 - MST is unique if all edge weights are distinct; multiple MSTs possible with duplicate weights.
 - Algorithm works on disconnected graphs (produces minimum spanning forest).
+- Prim's array form avoids the edge sort entirely, so minimum_spanning_tree
+  switches to it on dense graphs where E log E outweighs V².
 """
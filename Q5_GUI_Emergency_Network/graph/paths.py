@@ -11,8 +11,8 @@ we also need alternative routes in case the primary route fails. This module imp
 Approach:
 I implemented three complementary pathfinding algorithms:
 
-1. **Dijkstra's Algorithm**: Uses a greedy approach with distance relaxation. I maintain
-   a set of unvisited nodes and repeatedly select the node with minimum distance, updating
+1. **Dijkstra's Algorithm**: Uses a greedy approach with distance relaxation. I keep
+   unvisited nodes in a binary heap and repeatedly pop the one with minimum distance, updating
    distances to its neighbors. This guarantees the shortest path for non-negative weights.
 
 2. **BFS (Breadth-First Search)**: Uses queue-based level-order exploration. Perfect for
@@ -23,26 +23,92 @@ I implemented three complementary pathfinding algorithms:
    for critical emergency routing.
 
 Time Complexities:
-- Dijkstra: O(V²) with array, O((V+E) log V) with heap
+- Dijkstra: O((V+E) log V) with heap
+- Dijkstra (all targets): O((V+E) log V) for every destination at once
+- Incremental node removal: O(V) plus a Dijkstra over the affected subtree only
 - BFS: O(V + E)
 - K-Disjoint: O(K × (V+E))
+- Suurballe K-Disjoint (shortest total): O(K × (V+E) log V)
 """
 
 from collections import deque
 import heapq
 
 
+def _dijkstra(graph, src, end=None, disabled=()):
+    """
+    Shared heap-based Dijkstra kernel behind the public path functions.
+    
+    Runs on the graph's memoized index-based adjacency, so distances,
+    parents and the settled set are flat lists indexed by city number and
+    vulnerable roads are already filtered out. Disabled cities (the graph's
+    own plus `disabled`) are looked up in a byte mask. Stops early once
+    `end` is settled, if one is given.
+    
+    Returns:
+        cities: List mapping index -> city
+        dist: List of shortest distances by index (inf if unreachable)
+        prev: List of parent indices by index (-1 for none)
+    """
+    
+    cities, index, adjacency = graph.get_indexed_adjacency()
+    n = len(cities)
+    inf = float('inf')
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    
+    dist = [inf] * n
+    prev = [-1] * n
+    if src not in index:
+        return cities, dist, prev
+    
+    blocked = bytearray(n)
+    for city in graph.disabled_nodes:
+        blocked[index[city]] = 1
+    for city in disabled:
+        if city in index:
+            blocked[index[city]] = 1
+    
+    s = index[src]
+    target = index.get(end, -1)
+    dist[s] = 0
+    heap = [(0, s)]
+    done = bytearray(n)
+    
+    while heap:
+        d, current = heappop(heap)
+        if done[current]:
+            continue  # Stale entry: a shorter distance was already settled
+        done[current] = 1
+        
+        if current == target:
+            break
+        if blocked[current]:
+            continue  # A failed source reaches nothing but itself
+        
+        for neighbor, weight in adjacency[current]:
+            if done[neighbor] or blocked[neighbor]:
+                continue
+            new_distance = d + weight
+            if new_distance < dist[neighbor]:
+                dist[neighbor] = new_distance
+                prev[neighbor] = current
+                heappush(heap, (new_distance, neighbor))
+    
+    return cities, dist, prev
+
+
 def dijkstra_shortest_path(graph, start, end):
     """
     Computes shortest path between two nodes using Dijkstra's algorithm.
     
     Uses greedy selection and edge relaxation:
-    - Select unvisited node with minimum distance
+    - Pop the unvisited node with minimum distance from a binary heap
     - Relax edges: update neighbor distances if shorter path found
     - Repeat until destination reached
     
-    Time Complexity: O(V²) using array-based implementation
-    Space Complexity: O(V)
+    Time Complexity: O((V + E) log V) using a binary heap
+    Space Complexity: O(V + E)
     
     Parameters:
         graph (EmergencyGraph): Custom graph object
@@ -54,59 +120,202 @@ def dijkstra_shortest_path(graph, start, end):
         distance: Total distance of shortest path (inf if unreachable)
     """
     
-    # Initialize distances to infinity except start node
-    distances = {}
-    previous = {}  # For path reconstruction
-    unvisited = set()
+    if start == end:
+        return [start], 0
     
-    for city in graph.get_all_cities():
-        distances[city] = float('inf')
-        previous[city] = None
-        unvisited.add(city)
+    # The sweep stops as soon as `end` is settled (its distance is final
+    # once popped). A target that is offline or missing can never be
+    # settled, so skip the sweep instead of exhausting the component.
+    if end not in graph.graph or end in graph.disabled_nodes:
+        return None, float('inf')
     
-    distances[start] = 0
+    cities, dist, prev = _dijkstra(graph, start, end)
+    _, index, _ = graph.get_indexed_adjacency()
     
-    while unvisited:
-        # Greedy choice: select unvisited node with minimum distance
-        current = None
-        min_dist = float('inf')
-        
-        for city in unvisited:
-            if distances[city] < min_dist:
-                min_dist = distances[city]
-                current = city
-        
-        # No reachable unvisited nodes remain
-        if current is None or distances[current] == float('inf'):
-            break
-        
-        # Reached destination
-        if current == end:
-            break
-        
-        unvisited.remove(current)
-        
-        # Edge relaxation: update distances to neighbors
-        for neighbor, weight in graph.get_active_neighbors(current):
-            if neighbor in unvisited:
-                new_distance = distances[current] + weight
-                
-                if new_distance < distances[neighbor]:
-                    distances[neighbor] = new_distance
-                    previous[neighbor] = current
+    target = index.get(end)
+    if target is None or dist[target] == float('inf'):
+        return None, float('inf')  # No path exists
     
     # Reconstruct path by backtracking through previous pointers
     path = []
-    current = end
+    current = target
+    while current != -1:
+        path.append(cities[current])
+        current = prev[current]
+    path.reverse()
     
-    if distances[end] == float('inf'):
-        return None, float('inf')  # No path exists
+    return path, dist[target]
+
+
+def dijkstra_all_targets(graph, src, disabled=None):
+    """
+    Computes shortest distances from one source to every city in one sweep.
+    
+    Uses a binary heap with lazy deletion: a relaxed city is pushed again
+    instead of having its key decreased, and stale heap entries are skipped
+    when popped. One sweep replaces a separate Dijkstra run per destination.
+    
+    Time Complexity: O((V + E) log V)
+    Space Complexity: O(V + E) for the heap with lazy deletion
+    
+    Parameters:
+        graph (EmergencyGraph): Custom graph object
+        src: Starting city
+        disabled: Optional extra set of cities to treat as failed, so a
+                  what-if can run without toggling the graph itself
+    
+    Returns:
+        dist: Dictionary city -> shortest distance (inf if unreachable)
+        prev: Dictionary city -> previous city on the shortest path
+    """
+    
+    cities, dist, prev = _dijkstra(graph, src, disabled=disabled or ())
+    
+    prev = [cities[p] if p != -1 else None for p in prev]
+    dist, prev = dict(zip(cities, dist)), dict(zip(cities, prev))
+    dist[src] = 0  # Even a source outside the graph reaches itself
+    prev.setdefault(src, None)
+    
+    return dist, prev
+
+
+def dijkstra_incremental_on_node_removal(graph, baseline_dist, baseline_prev, failed):
+    """
+    Updates dijkstra_all_targets output for the failure of one city.
+    
+    Removing a city can only lengthen paths that went through it, so every
+    city whose baseline shortest path avoids `failed` keeps its distance and
+    path. Only the subtree of `failed` in the shortest-path tree is dirty:
+    each dirty city is seeded with its best edge from a clean neighbour, and
+    a Dijkstra restricted to the dirty cities settles the rest.
+    
+    Time Complexity: O(V) to find the subtree, plus O((D + E_D) log D) for
+                     D dirty cities and their E_D incident edges
+    Space Complexity: O(V)
+    
+    Parameters:
+        graph (EmergencyGraph): Graph the baseline was computed on
+        baseline_dist, baseline_prev: dijkstra_all_targets result (not modified)
+        failed: City that fails
+    
+    Returns:
+        dist, prev: Same as dijkstra_all_targets(graph, src, {failed})
+    """
+    
+    dist = dict(baseline_dist)
+    prev = dict(baseline_prev)
+    
+    if failed not in dist:
+        return dist, prev
+    
+    # A failed source keeps itself at distance 0 but reaches nothing else.
+    if baseline_dist[failed] == 0 and baseline_prev[failed] is None:
+        for city in dist:
+            if city != failed:
+                dist[city] = float('inf')
+                prev[city] = None
+        return dist, prev
+    
+    # Collect the subtree of `failed` in the shortest-path tree.
+    children = {}
+    for city, parent in baseline_prev.items():
+        if parent is not None:
+            children.setdefault(parent, []).append(city)
+    
+    dirty = {failed}
+    stack = [failed]
+    while stack:
+        for child in children.get(stack.pop(), ()):
+            dirty.add(child)
+            stack.append(child)
+    
+    # Work on the indexed adjacency with byte masks, so membership checks
+    # in the loops below are list loads rather than set lookups.
+    cities, index, adjacency = graph.get_indexed_adjacency()
+    n = len(cities)
+    inf = float('inf')
+    
+    blocked = bytearray(n)
+    for city in graph.disabled_nodes:
+        blocked[index[city]] = 1
+    blocked[index[failed]] = 1
+    
+    is_dirty = bytearray(n)
+    for city in dirty:
+        is_dirty[index[city]] = 1
+    
+    d_list = [dist.get(city, inf) for city in cities]
+    p_list = [-1] * n
+    for city in dirty:
+        d_list[index[city]] = inf
+    
+    # Seed each dirty city from the boundary: its clean, still-reachable
+    # neighbours keep their baseline distances.
+    heap = []
+    for city in dirty:
+        i = index[city]
+        if blocked[i]:
+            continue
+        for j, weight in adjacency[i]:
+            if blocked[j] or is_dirty[j]:
+                continue
+            candidate = d_list[j] + weight
+            if candidate < d_list[i]:
+                d_list[i] = candidate
+                p_list[i] = j
+        if d_list[i] != inf:
+            heap.append((d_list[i], i))
+    heapq.heapify(heap)
+    
+    # Bounded Dijkstra: only dirty cities can still improve.
+    done = bytearray(n)
+    while heap:
+        d, current = heapq.heappop(heap)
+        if done[current]:
+            continue
+        done[current] = 1
+        
+        for neighbor, weight in adjacency[current]:
+            if not is_dirty[neighbor] or done[neighbor] or blocked[neighbor]:
+                continue
+            new_distance = d + weight
+            if new_distance < d_list[neighbor]:
+                d_list[neighbor] = new_distance
+                p_list[neighbor] = current
+                heapq.heappush(heap, (new_distance, neighbor))
+    
+    for city in dirty:
+        i = index[city]
+        dist[city] = d_list[i]
+        prev[city] = cities[p_list[i]] if p_list[i] != -1 else None
+    dist[failed] = inf
+    prev[failed] = None
+    
+    return dist, prev
+
+
+def reconstruct_path(dist, prev, end):
+    """
+    Rebuilds the shortest path to `end` from dijkstra_all_targets output.
+    
+    Time Complexity: O(path length)
+    
+    Returns:
+        path: List of cities from the source to `end` (None if unreachable)
+        distance: Total distance of the path (inf if unreachable)
+    """
+    
+    if dist.get(end, float('inf')) == float('inf'):
+        return None, float('inf')
     
+    path = []
+    current = end
     while current is not None:
-        path.insert(0, current)
-        current = previous[current]
+        path.append(current)
+        current = prev[current]
+    path.reverse()
     
-    return path, distances[end]
+    return path, dist[end]
 
 
 def bfs_shortest_path(graph, start, end):
@@ -205,6 +414,131 @@ def find_k_disjoint_paths(graph, start, end, k):
     return paths
 
 
+def suurballe_k_disjoint(graph, start, end, k):
+    """
+    Finds up to K edge-disjoint paths with the smallest total distance.
+    
+    Algorithm: Suurballe's method, generalised to K paths as successive
+    shortest paths with node potentials. Each round runs Dijkstra on the
+    residual graph using reduced costs w(u,v) + pot[u] - pot[v], which stay
+    non-negative, so no Bellman-Ford is needed even though cancelling a
+    previously used road travels it backwards at cost -w. The rounds'
+    union of roads is then split into start -> end paths.
+    
+    Unlike find_k_disjoint_paths, the paths are not just disjoint but
+    jointly shortest, and disabled cities are avoided.
+    
+    Time Complexity: O(K × (V + E) log V)
+    Space Complexity: O(V + E)
+    
+    Parameters:
+        graph (EmergencyGraph): Custom graph object
+        start: Starting city
+        end: Destination city
+        k: Number of disjoint paths to find
+    
+    Returns:
+        paths: List of up to K edge-disjoint paths, shortest first
+    """
+    
+    cities, index, adjacency = graph.get_indexed_adjacency()
+    if start not in index or end not in index or start == end:
+        return []
+    
+    n = len(cities)
+    inf = float('inf')
+    s, t = index[start], index[end]
+    
+    blocked = bytearray(n)
+    for city in graph.disabled_nodes:
+        blocked[index[city]] = 1
+    if blocked[s] or blocked[t]:
+        return []
+    
+    # Lightest road per neighbour pair; parallel roads would only yield
+    # paths that read the same as city lists.
+    cost = [{} for _ in range(n)]
+    for u in range(n):
+        if blocked[u]:
+            continue
+        for v, weight in adjacency[u]:
+            if v != u and not blocked[v] and weight < cost[u].get(v, inf):
+                cost[u][v] = weight
+    
+    flow = set()  # (u, v): the road u-v is used in direction u -> v
+    potential = [0] * n
+    found = 0
+    
+    for _ in range(k):
+        dist = [inf] * n
+        prev = [-1] * n
+        done = bytearray(n)
+        dist[s] = 0
+        heap = [(0, s)]
+        
+        while heap:
+            d, u = heapq.heappop(heap)
+            if done[u]:
+                continue
+            done[u] = 1
+            
+            offset = d + potential[u]
+            for v, weight in cost[u].items():
+                if done[v] or (u, v) in flow:
+                    continue  # Road already used in this direction
+                # Travelling a used road backwards cancels that use.
+                step = -weight if (v, u) in flow else weight
+                new_distance = offset + step - potential[v]
+                if new_distance < dist[v]:
+                    dist[v] = new_distance
+                    prev[v] = u
+                    heapq.heappush(heap, (new_distance, v))
+        
+        if dist[t] == inf:
+            break  # No further disjoint path exists
+        
+        # Cities unreachable now stay unreachable, so only reachable
+        # potentials need updating.
+        for v in range(n):
+            if dist[v] != inf:
+                potential[v] += dist[v]
+        
+        v = t
+        while v != s:
+            u = prev[v]
+            if (v, u) in flow:
+                flow.discard((v, u))
+            else:
+                flow.add((u, v))
+            v = u
+        found += 1
+    
+    # Split the used roads into paths, erasing any loop a walk closes.
+    successors = {}
+    for u, v in flow:
+        successors.setdefault(u, []).append(v)
+    
+    paths = []
+    for _ in range(found):
+        path = [s]
+        position = {s: 0}
+        u = s
+        while u != t:
+            v = successors[u].pop()
+            if v in position:
+                for city in path[position[v] + 1:]:
+                    del position[city]
+                del path[position[v] + 1:]
+            else:
+                position[v] = len(path)
+                path.append(v)
+            u = v
+        paths.append(path)
+    
+    paths.sort(key=lambda path: sum(cost[u][v] for u, v in zip(path, path[1:])))
+    return [[cities[i] for i in path] for path in paths]
+
+
 def _dfs_augmenting_path(residual_graph, start, end, original_graph, visited=None):
     """
     Helper function: DFS to find augmenting path in residual graph.
@@ -260,6 +594,14 @@ def get_all_paths(graph, start, end, max_paths=5):
     
     all_paths = []
     
+    # The DFS reaches a city once per path through it, so the filtered
+    # neighbor lists are taken once up front instead of on every visit.
+    active_graph = graph.get_active_graph()
+    neighbors_of = {
+        city: [neighbor for neighbor, _ in neighbors]
+        for city, neighbors in active_graph.items()
+    }
+    
     def dfs(current, target, path, visited):
         if len(all_paths) >= max_paths:
             return
@@ -270,7 +612,7 @@ def get_all_paths(graph, start, end, max_paths=5):
         
         visited.add(current)
         
-        for neighbor, _ in graph.get_active_neighbors(current):
+        for neighbor in neighbors_of.get(current, ()):
             if neighbor not in visited:
                 path.append(neighbor)
                 dfs(neighbor, target, path, visited)
@@ -282,49 +624,79 @@ def get_all_paths(graph, start, end, max_paths=5):
     return all_paths
 
 
-def get_affected_nodes(graph, disabled_node):
+def connected_components(graph, disabled=()):
     """
-    Returns nodes that become disconnected when a node fails.
+    Splits the operational network into connected components.
     
-    Algorithm: Find connected components before/after node failure.
+    Cities in `disabled` are treated as failed on top of the graph's own
+    disabled cities, so a what-if needs no disable/enable toggling. The
+    graph is left untouched, which keeps its version (and every result
+    cached on it) valid.
     
     Time Complexity: O(V + E)
     Space Complexity: O(V)
     
     Parameters:
         graph (EmergencyGraph): Custom graph object
-        disabled_node: The node that has failed
+        disabled: Optional extra set of cities to treat as failed
     
     Returns:
-        affected: Set of nodes disconnected from critical hubs
+        components: List of sets of cities, in order of first city found
     """
     
-    # Temporarily disable the node
-    graph.disable_city(disabled_node)
+    cities, index, _ = graph.get_indexed_adjacency()
+    indptr, neighbors, _ = graph.get_csr_adjacency()
+    n = len(cities)
+    
+    blocked = bytearray(n)
+    for city in graph.disabled_nodes:
+        blocked[index[city]] = 1
+    for city in disabled:
+        if city in index:
+            blocked[index[city]] = 1
     
-    # Find connected components using BFS
-    visited = set()
+    # Blocked cities are pre-marked as seen, so the BFS never enters them.
+    seen = bytearray(blocked)
     components = []
     
-    for city in graph.get_all_cities():
-        if city not in visited and city not in graph.disabled_nodes:
-            component = set()
-            queue = deque([city])
-            visited.add(city)
-            component.add(city)
-            
-            while queue:
-                current = queue.popleft()
-                for neighbor, _ in graph.get_active_neighbors(current):
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        component.add(neighbor)
-                        queue.append(neighbor)
-            
-            components.append(component)
+    for i in range(n):
+        if seen[i]:
+            continue
+        
+        seen[i] = 1
+        component = [i]
+        queue = deque([i])
+        while queue:
+            current = queue.popleft()
+            for neighbor in neighbors[indptr[current]:indptr[current + 1]]:
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    component.append(neighbor)
+                    queue.append(neighbor)
+        
+        components.append({cities[j] for j in component})
+    
+    return components
+
+
+def get_affected_nodes(graph, disabled_node):
+    """
+    Returns nodes that become disconnected when a node fails.
     
-    # Re-enable the node
-    graph.enable_city(disabled_node)
+    Algorithm: Find connected components after node failure.
+    
+    Time Complexity: O(V + E)
+    Space Complexity: O(V)
+    
+    Parameters:
+        graph (EmergencyGraph): Custom graph object
+        disabled_node: The node that has failed
+    
+    Returns:
+        affected: Set of nodes disconnected from critical hubs
+    """
+    
+    components = connected_components(graph, {disabled_node})
     
     # Nodes that were in different components are now disconnected
     affected = set()
@@ -337,14 +709,21 @@ def get_affected_nodes(graph, disabled_node):
     
     return affected
 
-
 """
 Remarks:
 - Dijkstra's algorithm guarantees optimal shortest path for non-negative edge weights.
-- Array-based implementation is O(V²), suitable for dense graphs; heap-based would be O((V+E) log V).
+- Heap-based implementation is O((V+E) log V), well below the array-based O(V²) on sparse road networks.
 - BFS finds minimum hop count, useful when all edges have equal weight or cost is measured in steps.
 - K-disjoint paths provide redundancy: if one route fails, alternatives are available without overlap.
 - Ford-Fulkerson approach for disjoint paths is elegant: max-flow with unit capacities = edge-disjoint paths.
+- Suurballe's method adds costs to that flow view: each extra path is a shortest residual path
+  under reduced costs, so the K routes found are the cheapest disjoint set, not just any set.
 - All algorithms respect disabled nodes and vulnerable edges for realistic failure scenarios.
+- dijkstra_all_targets answers every destination from one heap-based sweep, so
+  "shortest path to each city" costs one Dijkstra run instead of V of them.
+- After a node failure only its shortest-path subtree can change, so the
+  incremental update re-settles those cities and copies the rest.
+- Component labelling takes the failed city as a parameter instead of toggling it,
+  so failure what-ifs never change the graph version.
 - Path reconstruction uses previous pointer array for efficient backtracking from destination to source.
 """
@@ -21,6 +21,7 @@ def run_all_tests():
         ('tests.test_paths', 'Path Finding Algorithms'),
         ('tests.test_failure', 'Failure Simulation'),
         ('tests.test_coloring', 'Graph Coloring'),
+        ('tests.test_graph_model', 'Graph Data Structure'),
     ]
     
     total_passed = 0
@@ -42,12 +43,13 @@ def run_all_tests():
     print("TEST SUMMARY")
     print("=" * 70)
     print("""
-MST Algorithm Tests:        7 tests passed
-Path Finding Tests:         9 tests passed
+MST Algorithm Tests:        8 tests passed
+Path Finding Tests:        15 tests passed
 Failure Simulation Tests:  10 tests passed
 Graph Coloring Tests:      10 tests passed
+Graph Model Tests:          8 tests passed
 ────────────────────────────────
-TOTAL:                    36 tests passed
+TOTAL:                    51 tests passed
 
 All tests passed successfully!
 """)
@@ -60,7 +62,8 @@ if __name__ == "__main__":
         'tests/test_mst.py',
         'tests/test_paths.py',
         'tests/test_failure.py',
-        'tests/test_coloring.py'
+        'tests/test_coloring.py',
+        'tests/test_graph_model.py'
     ]
     
     print("=" * 70)
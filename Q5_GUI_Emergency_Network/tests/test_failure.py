@@ -147,6 +147,7 @@ def test_failure_analysis_graph_unchanged():
     
     initial_cities = set(g.get_all_cities())
     initial_disabled = set(g.disabled_nodes)
+    initial_version = g.version
     
     analyzer = FailureAnalyzer(g)
     analyzer.analyze_node_failure(1)
@@ -156,6 +157,7 @@ def test_failure_analysis_graph_unchanged():
     
     assert initial_cities == final_cities, "Cities should not change"
     assert initial_disabled == final_disabled, "Disabled nodes should be restored"
+    assert g.version == initial_version, "Analysis should not invalidate cached results"
     print("✓ test_failure_analysis_graph_unchanged passed")
 
 
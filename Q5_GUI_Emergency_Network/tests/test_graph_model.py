@@ -0,0 +1,162 @@
+"""
+Test Suite for the Graph Data Structure
+Tests the version stamp and the bookkeeping kept alongside it.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from graph.graph_model import EmergencyGraph
+
+
+def test_version_changes_on_edits():
+    """Every mutation should stamp a new version."""
+    g = EmergencyGraph()
+    seen = {g.version}
+
+    for mutate in (
+        lambda: g.add_city(0),
+        lambda: g.add_road(0, 1, 3),
+        lambda: g.mark_vulnerable_road(0, 1),
+        lambda: g.unmark_vulnerable_road(0, 1),
+        lambda: g.disable_city(1),
+        lambda: g.enable_city(1),
+        lambda: g.remove_road(0, 1),
+        lambda: g.remove_city(1),
+    ):
+        mutate()
+        assert g.version not in seen, "Mutation should produce an unused version"
+        seen.add(g.version)
+
+    print("✓ test_version_changes_on_edits passed")
+
+
+def test_version_stable_on_reads_and_noops():
+    """Queries and idempotent no-ops should keep the version."""
+    g = EmergencyGraph()
+    g.add_road(0, 1, 3)
+    version = g.version
+
+    g.add_city(0)  # Already present
+    g.get_all_edges()
+    g.get_active_graph()
+    g.is_road_vulnerable(0, 1)
+
+    assert g.version == version, "Reads and no-ops should not change the version"
+    print("✓ test_version_stable_on_reads_and_noops passed")
+
+
+def test_versions_unique_across_graphs():
+    """Different graphs should never share a version."""
+    a = EmergencyGraph()
+    b = EmergencyGraph()
+    a.add_road(0, 1, 1)
+    b.add_road(0, 1, 1)
+
+    assert a.version != b.version, "Separate graphs should have distinct versions"
+    print("✓ test_versions_unique_across_graphs passed")
+
+
+def test_sorted_cities_follow_edits():
+    """Sorted city list should be reused until the graph changes."""
+    g = EmergencyGraph()
+    g.add_road(3, 1, 2)
+    g.add_city(2)
+    assert g.get_sorted_cities() == [1, 2, 3], "Cities should be sorted"
+
+    g.get_sorted_cities().append(99)  # Callers get a copy
+    assert g.get_sorted_cities() == [1, 2, 3], "Cached list should not be mutable"
+
+    g.add_city(0)
+    g.remove_city(2)
+    assert g.get_sorted_cities() == [0, 1, 3], "Edits should refresh the sorted list"
+    print("✓ test_sorted_cities_follow_edits passed")
+
+
+def test_next_city_id():
+    """Next city id should stay past every integer id ever added."""
+    g = EmergencyGraph()
+    assert g.next_city_id() == 0, "Empty graph should start at 0"
+
+    g.add_road(4, 2, 1)
+    assert g.next_city_id() == 5, "Next id should follow the largest id"
+
+    g.remove_city(4)
+    g.add_city("HQ")
+    assert g.next_city_id() == 5, "Removed ids and named cities should not affect it"
+    print("✓ test_next_city_id passed")
+
+
+def test_indexed_adjacency():
+    """Indexed adjacency should skip vulnerable roads and follow edits."""
+    g = EmergencyGraph()
+    g.add_road("A", "B", 2)
+    g.add_road("B", "C", 3)
+    g.mark_vulnerable_road("A", "B")
+
+    cities, index, adjacency = g.get_indexed_adjacency()
+    assert [cities[i] for i in range(len(cities))] == list(index), "Index should invert cities"
+    assert adjacency[index["B"]] == [(index["C"], 3)], "Vulnerable road should be excluded"
+    assert g.get_indexed_adjacency() is g.get_indexed_adjacency(), "Should be memoized per version"
+
+    g.unmark_vulnerable_road("A", "B")
+    _, index, adjacency = g.get_indexed_adjacency()
+    assert (index["B"], 2) in adjacency[index["A"]], "Edits should rebuild the adjacency"
+    print("✓ test_indexed_adjacency passed")
+
+
+def test_sorted_edges_follow_edits():
+    """Sorted edges should be ordered by weight and refreshed on edits."""
+    g = EmergencyGraph()
+    g.add_road(0, 1, 5)
+    g.add_road(1, 2, 1)
+    g.add_road(2, 0, 3)
+
+    assert [w for _, _, w in g.get_sorted_edges()] == [1, 3, 5], "Edges should sort by weight"
+    assert g.get_sorted_edges() is g.get_sorted_edges(), "Should be memoized per version"
+
+    g.remove_road(1, 2)
+    g.add_road(0, 3, 2)
+    assert [w for _, _, w in g.get_sorted_edges()] == [2, 3, 5], "Edits should re-sort the edges"
+
+    cities = g.get_all_cities()
+    first, second = g.get_sorted_edge_ends()
+    assert [(cities[a], cities[b]) for a, b in zip(first, second)] == \
+        [(u, v) for u, v, _ in g.get_sorted_edges()], "Endpoint numbers should match the edges"
+    print("✓ test_sorted_edges_follow_edits passed")
+
+
+def test_csr_adjacency():
+    """CSR rows should hold the same roads as the indexed adjacency."""
+    g = EmergencyGraph()
+    g.add_road("A", "B", 2)
+    g.add_road("B", "C", 3)
+    g.add_city("D")
+    g.mark_vulnerable_road("A", "B")
+
+    _, _, adjacency = g.get_indexed_adjacency()
+    indptr, neighbors, weights = g.get_csr_adjacency()
+    assert len(indptr) == len(adjacency) + 1, "One row per city"
+    for i, row in enumerate(adjacency):
+        lo, hi = indptr[i], indptr[i + 1]
+        assert list(zip(neighbors[lo:hi], weights[lo:hi])) == row, "Rows should match"
+    assert g.get_csr_adjacency() is g.get_csr_adjacency(), "Should be memoized per version"
+
+    g.unmark_vulnerable_road("A", "B")
+    indptr, _, _ = g.get_csr_adjacency()
+    assert indptr[-1] == 4, "Edits should rebuild the rows"
+    print("✓ test_csr_adjacency passed")
+
+
+if __name__ == "__main__":
+    test_version_changes_on_edits()
+    test_version_stable_on_reads_and_noops()
+    test_versions_unique_across_graphs()
+    test_sorted_cities_follow_edits()
+    test_next_city_id()
+    test_indexed_adjacency()
+    test_sorted_edges_follow_edits()
+    test_csr_adjacency()
+
+    print("\n✅ All graph model tests passed!")
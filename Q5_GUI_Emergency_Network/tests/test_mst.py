@@ -1,6 +1,6 @@
 """
 Test Suite for MST Algorithms
-Tests Kruskal's algorithm with various graph configurations.
+Tests Kruskal's and Prim's algorithms with various graph configurations.
 """
 
 import sys
@@ -8,7 +8,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from graph.graph_model import EmergencyGraph
-from graph.mst import kruskal_mst
+from graph.mst import kruskal_mst, prim_mst, minimum_spanning_tree
 from utils.metrics import GraphMetrics
 
 
@@ -132,6 +132,26 @@ def test_mst_properties():
     print("✓ test_mst_properties passed")
 
 
+def test_prim_matches_kruskal():
+    """Prim should find a spanning forest of the same weight as Kruskal."""
+    g = EmergencyGraph()
+    edges = [
+        (0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8),
+        (1, 2, 3),  # Parallel road
+        (4, 5, 2),  # Second component
+    ]
+    for u, v, w in edges:
+        g.add_road(u, v, w)
+    g.add_city(6)  # Isolated city
+    
+    mst, weight = prim_mst(g)
+    
+    assert weight == kruskal_mst(g)[1] == 10, f"Expected weight 10, got {weight}"
+    assert len(mst) == 4, f"Expected 4 edges (spanning forest), got {len(mst)}"
+    assert minimum_spanning_tree(g)[1] == 10, "Selector should agree on weight"
+    print("✓ test_prim_matches_kruskal passed")
+
+
 if __name__ == "__main__":
     test_kruskal_basic()
     test_kruskal_single_node()
@@ -140,5 +160,6 @@ if __name__ == "__main__":
     test_kruskal_large_graph()
     test_kruskal_with_vulnerable_edges()
     test_mst_properties()
+    test_prim_matches_kruskal()
     
     print("\n✅ All MST tests passed!")
@@ -8,7 +8,11 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from graph.graph_model import EmergencyGraph
-from graph.paths import dijkstra_shortest_path, bfs_shortest_path, find_k_disjoint_paths, get_affected_nodes
+from graph.paths import (
+    dijkstra_shortest_path, bfs_shortest_path, find_k_disjoint_paths, get_affected_nodes,
+    dijkstra_all_targets, dijkstra_incremental_on_node_removal, reconstruct_path,
+    suurballe_k_disjoint,
+)
 
 
 def test_dijkstra_basic():
@@ -174,6 +178,101 @@ def test_path_with_disabled_nodes():
     print("✓ test_path_with_disabled_nodes passed")
 
 
+def test_dijkstra_all_targets():
+    """Test one-sweep Dijkstra against per-destination runs."""
+    g = EmergencyGraph()
+    g.add_road(0, 1, 4)
+    g.add_road(0, 2, 1)
+    g.add_road(2, 1, 2)
+    g.add_road(1, 3, 5)
+    g.add_road(2, 3, 8)
+    g.add_city(4)  # Isolated
+    
+    dist, prev = dijkstra_all_targets(g, 0)
+    
+    for city in g.get_all_cities():
+        expected_path, expected_dist = dijkstra_shortest_path(g, 0, city)
+        path, distance = reconstruct_path(dist, prev, city)
+        assert distance == expected_dist, f"Distance to {city} should be {expected_dist}, got {distance}"
+        assert path == expected_path, f"Path to {city} should be {expected_path}, got {path}"
+    
+    print("✓ test_dijkstra_all_targets passed")
+
+
+def test_dijkstra_all_targets_disabled():
+    """Test that extra disabled cities are avoided without touching the graph."""
+    g = EmergencyGraph()
+    g.add_road(0, 1, 1)
+    g.add_road(1, 2, 1)
+    g.add_road(0, 2, 10)
+    version = g.version
+    
+    dist, prev = dijkstra_all_targets(g, 0, {1})
+    
+    assert reconstruct_path(dist, prev, 2) == ([0, 2], 10), "Should route around disabled city"
+    assert reconstruct_path(dist, prev, 1) == (None, float('inf')), "Disabled city should be unreachable"
+    assert g.version == version, "Graph should not be modified"
+    print("✓ test_dijkstra_all_targets_disabled passed")
+
+
+def test_incremental_node_removal():
+    """Test that patching the baseline matches a full recomputation."""
+    g = EmergencyGraph()
+    g.add_road(0, 1, 1)
+    g.add_road(1, 2, 1)
+    g.add_road(2, 3, 1)
+    g.add_road(0, 4, 5)
+    g.add_road(4, 3, 5)
+    g.add_road(0, 5, 2)
+    
+    baseline_dist, baseline_prev = dijkstra_all_targets(g, 0)
+    before = dict(baseline_dist)
+    
+    for failed in g.get_all_cities():
+        expected, _ = dijkstra_all_targets(g, 0, {failed})
+        dist, prev = dijkstra_incremental_on_node_removal(g, baseline_dist, baseline_prev, failed)
+        assert dist == expected, f"Failing {failed}: expected {expected}, got {dist}"
+    
+    dist, prev = dijkstra_incremental_on_node_removal(g, baseline_dist, baseline_prev, 1)
+    assert reconstruct_path(dist, prev, 3) == ([0, 4, 3], 10), "Should reroute around failed city"
+    assert baseline_dist == before, "Baseline should not be modified"
+    print("✓ test_incremental_node_removal passed")
+
+
+def test_dijkstra_offline_target():
+    """Test that offline or unknown targets are reported unreachable."""
+    g = EmergencyGraph()
+    g.add_road(0, 1, 1)
+    g.add_road(1, 2, 1)
+    g.disable_city(2)
+    
+    assert dijkstra_shortest_path(g, 0, 2) == (None, float('inf')), "Disabled target is unreachable"
+    assert dijkstra_shortest_path(g, 0, 99) == (None, float('inf')), "Unknown target is unreachable"
+    assert dijkstra_shortest_path(g, 0, 1) == ([0, 1], 1), "Other targets are unaffected"
+    print("✓ test_dijkstra_offline_target passed")
+
+
+def test_suurballe_k_disjoint():
+    """Test that Suurballe finds the cheapest pair of disjoint paths."""
+    g = EmergencyGraph()
+    # The shortest single path 0-1-2-3 blocks a second disjoint path,
+    # so the cheapest pair must give up its middle road.
+    g.add_road(0, 1, 1)
+    g.add_road(1, 2, 1)
+    g.add_road(2, 3, 1)
+    g.add_road(0, 2, 2)
+    g.add_road(1, 3, 2)
+    
+    paths = suurballe_k_disjoint(g, 0, 3, 2)
+    
+    assert sorted(paths) == [[0, 1, 3], [0, 2, 3]], f"Expected the cheapest disjoint pair, got {paths}"
+    assert suurballe_k_disjoint(g, 0, 3, 5) == paths, "Only two disjoint paths exist"
+    
+    g.disable_city(1)
+    assert suurballe_k_disjoint(g, 0, 3, 2) == [[0, 2, 3]], "Should avoid disabled cities"
+    print("✓ test_suurballe_k_disjoint passed")
+
+
 if __name__ == "__main__":
     test_dijkstra_basic()
     test_dijkstra_no_path()
@@ -185,5 +284,10 @@ if __name__ == "__main__":
     test_affected_nodes_no_disconnection()
     test_vulnerable_edges()
     test_path_with_disabled_nodes()
+    test_dijkstra_all_targets()
+    test_dijkstra_all_targets_disabled()
+    test_incremental_node_removal()
+    test_dijkstra_offline_target()
+    test_suurballe_k_disjoint()
     
     print("\n✅ All path tests passed!")
@@ -71,10 +71,20 @@ class AVLTree(BinarySearchTree):
             self.size += 1
             return TreeNode(value, 1)
         
+        # A node's height and balance depend only on its children's heights.
+        # If the changed child's height is the same as before (the insert
+        # was absorbed or a rotation below restored it), nothing above can
+        # change either, so the height update and rebalance are skipped.
         if value < node.value:
+            old_height = self._get_height(node.left)
             node.left = self._insert_avl_recursive(node.left, value)
+            if self._get_height(node.left) == old_height:
+                return node
         elif value > node.value:
+            old_height = self._get_height(node.right)
             node.right = self._insert_avl_recursive(node.right, value)
+            if self._get_height(node.right) == old_height:
+                return node
         else:
             return node  # Duplicate
         
@@ -105,10 +115,18 @@ class AVLTree(BinarySearchTree):
         if node is None:
             return None
         
+        # Same early exit as insert: an unchanged child height means this
+        # node (and every ancestor) keeps its height and balance.
         if value < node.value:
+            old_height = self._get_height(node.left)
             node.left = self._delete_avl_recursive(node.left, value)
+            if self._get_height(node.left) == old_height:
+                return node
         elif value > node.value:
+            old_height = self._get_height(node.right)
             node.right = self._delete_avl_recursive(node.right, value)
+            if self._get_height(node.right) == old_height:
+                return node
         else:
             # Node to delete found
             self.size -= 1
@@ -121,22 +139,17 @@ class AVLTree(BinarySearchTree):
                 return node.left
             else:
                 # Find inorder successor
-                successor_parent = node
                 successor = node.right
                 
                 while successor.left is not None:
-                    successor_parent = successor
                     successor = successor.left
                 
                 node.value = successor.value
                 
-                if successor_parent == node:
-                    node.right = successor.right
-                else:
-                    successor_parent.left = successor.right
-        
-        if node is None:
-            return None
+                # Unlink it through _remove_min so heights along the way
+                # down stay exact (and get rebalanced), which the early
+                # exits above rely on.
+                node.right = self._remove_min(node.right)
         
         # Update height and rebalance
         node.height = 1 + max(self._get_height(node.left),
@@ -144,6 +157,23 @@ class AVLTree(BinarySearchTree):
         
         return self._rebalance(node)
     
+    def _remove_min(self, node):
+        """
+        Removes the smallest node of a non-empty subtree, updating heights
+        and rebalancing on the way back up.
+        
+        Returns:
+            node: New root of the subtree
+        """
+        if node.left is None:
+            return node.right
+        
+        node.left = self._remove_min(node.left)
+        node.height = 1 + max(self._get_height(node.left),
+                              self._get_height(node.right))
+        
+        return self._rebalance(node)
+    
     def _get_height(self, node):
         """Get height of a node."""
         return node.height if node is not None else 0
@@ -276,7 +306,11 @@ def rebalance_tree(old_tree):
     
     Algorithm:
     1. Extract all values in sorted order (inorder traversal)
-    2. Build balanced BST by inserting median elements first (recursive)
+    2. Build balanced BST directly: the middle element becomes the root and
+       each half becomes a subtree (recursive), with heights set on the way up
+    
+    The result is balanced by construction, so no AVL inserts or rotations
+    are needed: every node is created once and linked in place.
     
     Time Complexity: O(n)
     Space Complexity: O(n)
@@ -291,48 +325,59 @@ def rebalance_tree(old_tree):
     # Get all values in sorted order
     values = old_tree.inorder_traversal()
     
-    if not values:
-        avl_tree = AVLTree()
-        return avl_tree
-    
-    # Build AVL tree by inserting in order that creates balance
     avl_tree = AVLTree()
-    _build_balanced_tree(avl_tree, values, 0, len(values) - 1)
+    avl_tree.root = _build_balanced_tree(values, 0, len(values) - 1)
+    avl_tree.size = len(values)
     
     return avl_tree
 
 
-def _build_balanced_tree(avl_tree, sorted_values, low, high):
+def _build_balanced_tree(sorted_values, low, high):
     """
     Recursive helper to build balanced tree from sorted array.
     
     Algorithm:
-    1. Find middle element
-    2. Insert it to create root
-    3. Recursively build left subtree (elements below middle)
-    4. Recursively build right subtree (elements above middle)
+    1. Find middle element and make it the subtree root
+    2. Recursively build left subtree (elements below middle)
+    3. Recursively build right subtree (elements above middle)
+    4. Set the root's height from its children
     
     Time Complexity: O(n)
     
     Parameters:
-        avl_tree: AVL tree to insert into
         sorted_values: Array of sorted values
         low: Low index
         high: High index
+    
+    Returns:
+        node: Root of the balanced subtree (None if the range is empty)
     """
     
-    if low <= high:
-        mid = (low + high) // 2
-        avl_tree.insert(sorted_values[mid])
-        
-        _build_balanced_tree(avl_tree, sorted_values, low, mid - 1)
-        _build_balanced_tree(avl_tree, sorted_values, mid + 1, high)
+    if low > high:
+        return None
+    
+    mid = (low + high) // 2
+    node = TreeNode(sorted_values[mid])
+    node.left = _build_balanced_tree(sorted_values, low, mid - 1)
+    node.right = _build_balanced_tree(sorted_values, mid + 1, high)
+    
+    left_height = node.left.height if node.left else 0
+    right_height = node.right.height if node.right else 0
+    node.height = 1 + max(left_height, right_height)
+    
+    return node
 
 
 def analyze_tree_balance(tree):
     """
     Analyzes balance characteristics of a tree.
     
+    Height and balance come from a single iterative post-order pass
+    (see _height_and_balance), instead of separate recursive walks for
+    each metric.
+    
+    Time Complexity: O(n)
+    
     Parameters:
         tree (BinarySearchTree): Tree to analyze
     
@@ -340,19 +385,65 @@ def analyze_tree_balance(tree):
         analysis: Dictionary with balance metrics
     """
     
+    height, is_balanced = _height_and_balance(tree.root)
+    optimal_height = _calculate_optimal_height(tree.size)
+    
     analysis = {
-        'is_balanced': tree.is_balanced(),
-        'height': tree.get_height(),
+        'is_balanced': is_balanced,
+        'height': height,
         'size': tree.size,
-        'max_path_length': tree.get_max_depth_path_length(),
-        'balance_factor': 'Balanced' if tree.is_balanced() else 'Unbalanced',
-        'optimal_height': _calculate_optimal_height(tree.size),
-        'height_overhead': tree.get_height() - _calculate_optimal_height(tree.size)
+        'max_path_length': height,  # Longest root-to-leaf path, in nodes
+        'balance_factor': 'Balanced' if is_balanced else 'Unbalanced',
+        'optimal_height': optimal_height,
+        'height_overhead': height - optimal_height
     }
     
     return analysis
 
 
+def _height_and_balance(root):
+    """
+    Computes tree height and the AVL balance property in one pass.
+    
+    Iterative post-order with an explicit (node, children_done) stack, so
+    a skewed tree (height ~ n before rebalancing) needs no recursion.
+    Child heights are kept only until their parent combines them.
+    Once an imbalance is found, the remaining nodes skip the balance check.
+    
+    Time Complexity: O(n)
+    Space Complexity: O(h)
+    
+    Returns:
+        height: Height of tree (0 for empty)
+        is_balanced: Whether every node satisfies |left - right| <= 1
+    """
+    
+    heights = {}
+    is_balanced = True
+    stack = [(root, False)] if root is not None else []
+    
+    while stack:
+        node, children_done = stack.pop()
+        
+        if not children_done:
+            stack.append((node, True))
+            if node.right is not None:
+                stack.append((node.right, False))
+            if node.left is not None:
+                stack.append((node.left, False))
+            continue
+        
+        left_height = heights.pop(id(node.left), 0)
+        right_height = heights.pop(id(node.right), 0)
+        
+        if is_balanced and abs(left_height - right_height) > 1:
+            is_balanced = False
+        
+        heights[id(node)] = 1 + max(left_height, right_height)
+    
+    return heights.pop(id(root), 0), is_balanced
+
+
 def _calculate_optimal_height(n):
     """Calculate optimal height for n nodes (log2(n+1))."""
     if n <= 0:
@@ -375,5 +466,7 @@ Remarks:
 - Balance factor calculation (left_height - right_height) determines rotation type needed.
 - Rebalancing algorithm converts any BST to AVL by sorting values and building balanced tree.
 - Height tracking at each node enables efficient balance factor computation.
+- Insert/delete stop adjusting ancestors as soon as a subtree's height comes back
+  unchanged, so at most the nodes up to the first absorbed change are revisited.
 - AVL trees maintain stricter balance than Red-Black trees (better search, more rotations).
 """
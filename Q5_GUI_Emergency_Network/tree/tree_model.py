@@ -30,6 +30,10 @@ Time Complexity (unbalanced):
 
 class TreeNode:
     """Represents a single node in the command hierarchy tree."""
+
+    # Fixed attribute layout: no per-node __dict__, so every node is
+    # smaller and traversals read fields from fixed offsets.
+    __slots__ = ('value', 'left', 'right', 'height', 'level')
     
     def __init__(self, value, height=1):
         """
@@ -192,46 +196,58 @@ class BinarySearchTree:
         In-order traversal (Left, Root, Right).
         Returns nodes in sorted order.
         
+        Iterative with an explicit stack of pending ancestors, so a skewed
+        tree (height ~ n) neither hits the recursion limit nor pays a
+        Python call per node.
+        
         Time Complexity: O(n)
+        Space Complexity: O(h)
         
         Returns:
             values: Sorted list of values
         """
         result = []
-        self._inorder_recursive(self.root, result)
-        return result
-    
-    def _inorder_recursive(self, node, result):
-        """Recursive helper for in-order traversal."""
-        if node is None:
-            return
+        stack = []
+        node = self.root
+        
+        while stack or node is not None:
+            # Walk down the left spine, remembering each ancestor
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            
+            node = stack.pop()
+            result.append(node.value)
+            node = node.right
         
-        self._inorder_recursive(node.left, result)
-        result.append(node.value)
-        self._inorder_recursive(node.right, result)
+        return result
     
     def preorder_traversal(self):
         """
         Pre-order traversal (Root, Left, Right).
         Useful for tree reconstruction.
         
+        Iterative: the right child is pushed before the left one so the
+        left subtree is popped (visited) first.
+        
         Time Complexity: O(n)
+        Space Complexity: O(h)
         
         Returns:
             values: Pre-order list of values
         """
         result = []
-        self._preorder_recursive(self.root, result)
-        return result
-    
-    def _preorder_recursive(self, node, result):
-        """Recursive helper for pre-order traversal."""
-        if node is None:
-            return
+        stack = [self.root] if self.root is not None else []
+        
+        while stack:
+            node = stack.pop()
+            result.append(node.value)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
         
-        result.append(node.value)
-        self._preorder_recursive(node.left, result)
-        self._preorder_recursive(node.right, result)
+        return result
     
     def get_height(self):
         """
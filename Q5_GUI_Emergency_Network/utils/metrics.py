@@ -39,7 +39,7 @@ class AlgorithmMetrics:
             'Dijkstra': 'O(V^2) - dense graphs, O((V+E) log V) - with heap',
             'BFS': 'O(V + E) - linear in graph size',
             'DFS': 'O(V + E) - linear in graph size',
-            'K-Disjoint Paths': 'O(K * (V + E)) - K iterations of DFS',
+            'K-Disjoint Paths': 'O(K * (V + E) log V) - K Dijkstra rounds (Suurballe)',
             'Graph Coloring': 'O(V^2 + E) - greedy with degree check',
             'AVL Rebalance': 'O(log n) - amortized per operation',
             'Cascade Failure': 'O(iterations * V^2) - iterative analysis'
@@ -126,7 +126,7 @@ class GraphMetrics:
         """
         Calculate graph diameter (longest shortest path).
         
-        Time Complexity: O(V^3) with Floyd-Warshall or O(V^2) with repeated BFS
+        Time Complexity: O(V × (V+E) log V) - one Dijkstra sweep per source
         
         Parameters:
             graph: EmergencyGraph object
@@ -134,15 +134,16 @@ class GraphMetrics:
         Returns:
             diameter: Maximum distance between any two nodes
         """
-        from graph.paths import dijkstra_shortest_path
+        from graph.paths import dijkstra_all_targets
         
         all_cities = graph.get_all_cities()
         max_distance = 0
         
         for start in all_cities:
+            dist, _ = dijkstra_all_targets(graph, start)
             for end in all_cities:
                 if start != end:
-                    _, distance = dijkstra_shortest_path(graph, start, end)
+                    distance = dist[end]
                     if distance != float('inf'):
                         max_distance = max(max_distance, distance)
         
@@ -153,13 +154,15 @@ class GraphMetrics:
         """
         Estimate connectivity of graph (percentage of connected node pairs).
         
+        Time Complexity: O(V × (V+E) log V) - one Dijkstra sweep per source
+        
         Parameters:
             graph: EmergencyGraph object
         
         Returns:
             connectivity: Percentage of connected pairs (0-100)
         """
-        from graph.paths import dijkstra_shortest_path
+        from graph.paths import dijkstra_all_targets
         
         all_cities = graph.get_all_cities()
         
@@ -170,11 +173,11 @@ class GraphMetrics:
         total_pairs = 0
         
         for start in all_cities:
+            dist, _ = dijkstra_all_targets(graph, start)
             for end in all_cities:
                 if start != end:
                     total_pairs += 1
-                    _, distance = dijkstra_shortest_path(graph, start, end)
-                    if distance != float('inf'):
+                    if dist[end] != float('inf'):
                         connected_pairs += 1
         
         if total_pairs == 0:
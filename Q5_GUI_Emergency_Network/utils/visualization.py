@@ -4,15 +4,55 @@ Provides functions to render graphs and trees in the UI.
 """
 
 import streamlit as st
+import functools
 import json
 import os
 import tempfile
 from pathlib import Path
-try:
-    from pyvis.network import Network
-    PYVIS_AVAILABLE = True
-except ImportError:
-    PYVIS_AVAILABLE = False
+from graph.graph_model import EmergencyGraph
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pyvis_network():
+    """
+    Imports pyvis on first use rather than when the app starts, so a cold
+    server boot does not pay for it. Cached, so later calls are free.
+    
+    Returns:
+        Network: pyvis Network class, or None if pyvis is not installed
+    """
+    try:
+        from pyvis.network import Network
+    except ImportError:
+        return None
+    return Network
+
+
+def _network_html(net):
+    """
+    Renders a pyvis network to an HTML string.
+    
+    pyvis 0.3+ renders straight to a string; save_graph would write the
+    same HTML to disk (plus its lib/ assets) only for us to read it back.
+    Older pyvis can only write files, so it round-trips through a temp file.
+    """
+    if hasattr(net, 'generate_html'):
+        return net.generate_html(notebook=False)
+    
+    html_file = tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False)
+    html_path = html_file.name
+    html_file.close()
+    
+    try:
+        net.save_graph(html_path)
+        with open(html_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    finally:
+        # Clean up temp file
+        try:
+            os.unlink(html_path)
+        except OSError:
+            pass
 
 
 def visualize_graph_edges(graph, title="Graph Edges"):
@@ -167,23 +207,20 @@ def visualize_tree(tree, title="Command Hierarchy Tree"):
         st.info("Tree is empty")
         return
     
-    if not PYVIS_AVAILABLE:
+    if _load_pyvis_network() is None:
         st.error("Pyvis library not installed. Install with: pip install pyvis")
         return
     
     try:
-        # Create pyvis network for tree
-        net = Network(height="450px", width="100%", directed=True, notebook=False)
-
         # Collect nodes and edges
         edges_list = []
-        node_values = set()
+        node_values = []
 
         def traverse(node):
             if node is None:
                 return
 
-            node_values.add(node.value)
+            node_values.append(node.value)
 
             if node.left:
                 edges_list.append((node.value, node.left.value))
@@ -195,58 +232,7 @@ def visualize_tree(tree, title="Command Hierarchy Tree"):
 
         traverse(tree.root)
 
-        # Add nodes first
-        for value in node_values:
-            net.add_node(
-                str(value),
-                label=str(value),
-                title=f"Value: {value}",
-                color="#1f77b4",
-                size=30,
-                font={'size': 16, 'color': 'white', 'bold': True},
-                shape='circle'
-            )
-
-        # Add edges after all nodes exist
-        for parent, child in edges_list:
-            net.add_edge(str(parent), str(child), arrows="to", color="#888888", width=2)
-
-        # Structured hierarchical layout (root on top, children below)
-        net.set_options("""
-        {
-          "layout": {
-            "hierarchical": {
-              "enabled": true,
-              "direction": "UD",
-              "sortMethod": "directed",
-              "levelSeparation": 120,
-              "nodeSpacing": 140,
-              "treeSpacing": 200
-            }
-          },
-          "physics": {
-            "enabled": false
-          }
-        }
-        """)
-        
-        # Generate HTML file
-        html_file = tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False)
-        html_path = html_file.name
-        html_file.close()
-        
-        # Save network to HTML file
-        net.save_graph(html_path)
-        
-        # Read HTML content
-        with open(html_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        # Clean up temp file
-        try:
-            os.unlink(html_path)
-        except:
-            pass
+        html_content = _build_tree_html(tuple(node_values), tuple(edges_list))
         
         # Display in Streamlit
         st.components.v1.html(html_content, height=500, scrolling=False)
@@ -277,6 +263,57 @@ def visualize_tree(tree, title="Command Hierarchy Tree"):
         st.code(traceback.format_exc())
 
 
+@st.cache_data
+def _build_tree_html(node_values, edges_list):
+    """
+    Build the pyvis HTML for a tree view.
+    
+    Cached per (nodes, parent-child edges): the pre-order node tuple and
+    edge tuple pin down the tree's shape, so reruns that show an unchanged
+    tree reuse the HTML instead of re-serializing the network.
+    """
+    # Create pyvis network for tree
+    Network = _load_pyvis_network()
+    net = Network(height="450px", width="100%", directed=True, notebook=False)
+
+    # Add nodes first
+    for value in node_values:
+        net.add_node(
+            str(value),
+            label=str(value),
+            title=f"Value: {value}",
+            color="#1f77b4",
+            size=30,
+            font={'size': 16, 'color': 'white', 'bold': True},
+            shape='circle'
+        )
+
+    # Add edges after all nodes exist
+    for parent, child in edges_list:
+        net.add_edge(str(parent), str(child), arrows="to", color="#888888", width=2)
+
+    # Structured hierarchical layout (root on top, children below)
+    net.set_options("""
+    {
+      "layout": {
+        "hierarchical": {
+          "enabled": true,
+          "direction": "UD",
+          "sortMethod": "directed",
+          "levelSeparation": 120,
+          "nodeSpacing": 140,
+          "treeSpacing": 200
+        }
+      },
+      "physics": {
+        "enabled": false
+      }
+    }
+    """)
+    
+    return _network_html(net)
+
+
 def visualize_failure_analysis(analysis, title="Failure Analysis Results"):
     """
     Display failure analysis results.
@@ -384,15 +421,20 @@ def create_algorithm_info_panel(algorithm_name):
             'space': 'O(V + E)',
             'desc': 'Greedy algorithm that builds MST by selecting edges in increasing weight order, using Union-Find for cycle detection.'
         },
+        'Prim MST': {
+            'time': 'O(V² + E)',
+            'space': 'O(V + E)',
+            'desc': 'Grows the MST from a start city, each step adding the city reached by the lightest road from the tree. Used instead of Kruskal on dense graphs.'
+        },
         'Dijkstra': {
-            'time': 'O(V²)',
-            'space': 'O(V)',
-            'desc': 'Finds shortest paths from a source node to all other nodes. Uses greedy selection of unvisited node with minimum distance.'
+            'time': 'O((V+E) log V)',
+            'space': 'O(V + E)',
+            'desc': 'Finds shortest paths from a source node to all other nodes. Uses greedy selection of unvisited node with minimum distance from a binary heap.'
         },
         'K-Disjoint Paths': {
-            'time': 'O(K × (V + E))',
+            'time': 'O(K × (V + E) log V)',
             'space': 'O(V + E)',
-            'desc': 'Finds K edge-disjoint paths using max-flow approach with Ford-Fulkerson algorithm.'
+            'desc': 'Finds K edge-disjoint paths with minimum total distance using Suurballe\'s successive shortest paths.'
         },
         'Graph Coloring': {
             'time': 'O(V² + E)',
@@ -416,6 +458,94 @@ def create_algorithm_info_panel(algorithm_name):
         st.write(f"**Approach:** {info['desc']}")
 
 
+@st.cache_data(hash_funcs={EmergencyGraph: lambda g: g.version})
+def _build_pyvis_html(graph, height, mst_edges=None, highlight_nodes=None, highlight_edges=None, node_colors=None):
+    """
+    Build the pyvis HTML for a graph view.
+    
+    Cached per (graph version, height, highlights): reruns that show an
+    unchanged graph reuse the HTML instead of re-serializing the network.
+    """
+    # Create pyvis network
+    Network = _load_pyvis_network()
+    net = Network(height=f"{height}px", width="100%", directed=False, notebook=False)
+    
+    # Add nodes
+    for node in graph.get_all_cities():
+        node_color = '#FF6B6B'
+        if node_colors and node in node_colors:
+            node_color = node_colors[node]
+        elif highlight_nodes and node in highlight_nodes:
+            node_color = highlight_nodes[node]
+        net.add_node(
+            node, 
+            label=str(node), 
+            size=40, 
+            color=node_color,
+            font={'size': 18, 'color': 'white', 'bold': True},
+            shape='circle'
+        )
+    
+    # Create MST edge set for quick lookup
+    mst_edge_set = set()
+    if mst_edges:
+        for u, v, w in mst_edges:
+            mst_edge_set.add(tuple(sorted([u, v])))
+
+    # Highlight edge set for quick lookup
+    highlight_edge_set = set()
+    if highlight_edges:
+        for u, v in highlight_edges:
+            highlight_edge_set.add(tuple(sorted([u, v])))
+    
+    # Add edges
+    added_edges = set()
+    
+    for u, v, weight in graph.get_all_edges():
+        edge_key = tuple(sorted([u, v]))
+        if edge_key in added_edges:
+            continue
+        added_edges.add(edge_key)
+        
+        # Determine edge color
+        if edge_key in highlight_edge_set:
+            edge_color = '#FFD700'  # Gold for highlighted path
+            edge_width = 5
+        elif edge_key in mst_edge_set:
+            edge_color = '#00FF00'  # Green for MST edges
+            edge_width = 4
+        elif graph.is_road_vulnerable(u, v):
+            edge_color = '#FF6B6B'  # Red for vulnerable
+            edge_width = 3
+        else:
+            edge_color = '#4ECDC4'  # Teal for normal
+            edge_width = 2
+        
+        net.add_edge(
+            u, v, 
+            label=str(weight),
+            title=f"Distance: {weight}", 
+            color=edge_color, 
+            width=edge_width,
+            font={'size': 14, 'color': '#333333', 'strokeWidth': 0, 'align': 'middle'}
+        )
+    
+    return _network_html(net)
+
+
+@st.cache_data(hash_funcs={EmergencyGraph: lambda g: g.version})
+def _graph_stats(graph):
+    """
+    Counts shown under every graph view: (nodes, roads, total distance,
+    vulnerable roads). Cached per graph version, so the edge scan runs
+    once per graph state rather than once per rendered view.
+    """
+    edges = graph.get_all_edges()
+    total_distance = sum(w for _, _, w in edges)
+    vulnerable = sum(1 for u, v, _ in edges if graph.is_road_vulnerable(u, v))
+    return len(graph.graph), len(edges), total_distance, vulnerable
+
+
 def render_graph_with_pyvis(graph, height=600, mst_edges=None, highlight_nodes=None, highlight_edges=None, node_colors=None):
     """
     Render an interactive network graph visualization using pyvis.
@@ -424,119 +554,35 @@ def render_graph_with_pyvis(graph, height=600, mst_edges=None, highlight_nodes=N
         node_colors: Dictionary mapping node -> color for graph coloring visualization
     """
     
-    if not PYVIS_AVAILABLE:
+    if _load_pyvis_network() is None:
         st.error("Pyvis library not installed. Install with: pip install pyvis")
         return
     
     try:
-        import tempfile
-        import os
-        
-        # Create pyvis network
-        net = Network(height=f"{height}px", width="100%", directed=False, notebook=False)
-        
-        # Add nodes
-        nodes = graph.get_all_cities()
-        if not nodes:
+        if not graph.graph:
             st.info("No nodes in the graph. Add some cities to get started!")
             return
-            
-        for node in nodes:
-            node_color = '#FF6B6B'
-            if node_colors and node in node_colors:
-                node_color = node_colors[node]
-            elif highlight_nodes and node in highlight_nodes:
-                node_color = highlight_nodes[node]
-            net.add_node(
-                node, 
-                label=str(node), 
-                size=40, 
-                color=node_color,
-                font={'size': 18, 'color': 'white', 'bold': True},
-                shape='circle'
-            )
-        
-        # Create MST edge set for quick lookup
-        mst_edge_set = set()
-        if mst_edges:
-            for u, v, w in mst_edges:
-                mst_edge_set.add(tuple(sorted([u, v])))
-
-        # Highlight edge set for quick lookup
-        highlight_edge_set = set()
-        if highlight_edges:
-            for u, v in highlight_edges:
-                highlight_edge_set.add(tuple(sorted([u, v])))
-        
-        # Add edges
-        edges = graph.get_all_edges()
-        added_edges = set()
-        
-        for u, v, weight in edges:
-            edge_key = tuple(sorted([u, v]))
-            if edge_key in added_edges:
-                continue
-            added_edges.add(edge_key)
-            
-            # Determine edge color
-            if edge_key in highlight_edge_set:
-                edge_color = '#FFD700'  # Gold for highlighted path
-                edge_width = 5
-            elif edge_key in mst_edge_set:
-                edge_color = '#00FF00'  # Green for MST edges
-                edge_width = 4
-            elif graph.is_road_vulnerable(u, v):
-                edge_color = '#FF6B6B'  # Red for vulnerable
-                edge_width = 3
-            else:
-                edge_color = '#4ECDC4'  # Teal for normal
-                edge_width = 2
-            
-            net.add_edge(
-                u, v, 
-                label=str(weight),
-                title=f"Distance: {weight}", 
-                color=edge_color, 
-                width=edge_width,
-                font={'size': 14, 'color': '#333333', 'strokeWidth': 0, 'align': 'middle'}
-            )
-        
-        # Generate HTML file
-        html_file = tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False)
-        html_path = html_file.name
-        html_file.close()
-        
-        # Save network to HTML file
-        net.save_graph(html_path)
-        
-        # Read HTML content
-        with open(html_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
         
-        # Clean up temp file
-        try:
-            os.unlink(html_path)
-        except:
-            pass
+        html_content = _build_pyvis_html(
+            graph, height, mst_edges, highlight_nodes, highlight_edges, node_colors
+        )
         
         # Display in Streamlit
         st.components.v1.html(html_content, height=height, scrolling=False)
         
         # Display stats
+        node_count, road_count, total_distance, vulnerable = _graph_stats(graph)
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Nodes", len(nodes))
+            st.metric("Nodes", node_count)
         with col2:
-            st.metric("Roads", len(edges))
+            st.metric("Roads", road_count)
         with col3:
-            total_distance = sum(w for _, _, w in edges) if edges else 0
             st.metric("Distance", total_distance)
         with col4:
-            vulnerable = sum(1 for u, v, _ in edges if graph.is_road_vulnerable(u, v))
             st.metric("Vulnerable", vulnerable)
     
     except Exception as e:
         st.error(f"Graph error: {str(e)}")
         import traceback
         st.code(traceback.format_exc())
-